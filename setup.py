@@ -8,12 +8,19 @@ setup(
     install_requires=[
         "faiss-cpu",
         "numpy<2",
+        "orjson",
         "requests",
         "torch",
         "transformers",
         "sentencepiece",
         "streamlit",
     ],
+    extras_require={
+        "onnx": ["optimum[onnxruntime]"],
+        "langchain": ["langchain-text-splitters"],
+        "ipex": ["intel-extension-for-pytorch"],
+        "ollama": ["aiohttp"],
+    },
     entry_points={
         'console_scripts': [
             'codepilot=codepilot.cli:main',
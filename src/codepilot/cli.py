@@ -1,13 +1,11 @@
 import os
 import argparse
-import numpy as np
 from typing import List, Dict, Any, Tuple
 
-from .processors import AstParser, Chunker, MetadataExtractor
+from .processors import AstParser, Chunker, MetadataExtractor, Pipeline
 from .vector_db import FaissVectorStore, EmbeddingGenerator
 from .llm import OllamaClient
 from .engine import Retriever, ResponseGenerator
-from .config import Config
 from .logging.logger import get_logger
 
 
@@ -26,6 +24,7 @@ class CodePilot:
         self.ast_parser = AstParser()
         self.chunker = Chunker()
         self.metadata_extractor = MetadataExtractor()
+        self.pipeline = Pipeline(self.chunker, self.metadata_extractor)
         self.embedding_generator = EmbeddingGenerator()
         self.vector_store = FaissVectorStore()
         self.llm_client = OllamaClient()
@@ -46,19 +45,24 @@ class CodePilot:
         self.logger.info("Parsing Python files...")
         documents = self.ast_parser.parse_directory(directory_path)
         
-        # Enrich with metadata
-        self.logger.info("Extracting metadata...")
-        documents = self.metadata_extractor.enrich_metadata(documents)
+        # Enrich with metadata and chunk in one fused streaming pass; the
+        # embedding stage below needs random access, so materialize here
+        self.logger.info("Extracting metadata and chunking documents...")
+        chunked_documents = list(self.pipeline.process(documents))
         
-        # Chunk documents
-        self.logger.info("Chunking documents...")
-        chunked_documents = self.chunker.chunk_documents(documents)
-        
-        # Generate embeddings
+        # Generate embeddings; the generator serves byte-identical chunks
+        # from its content-hash disk cache and length-buckets the rest
         self.logger.info("Generating embeddings...")
-        texts = [doc["content"] for doc in chunked_documents]
-        embeddings = self.embedding_generator.generate_embeddings(texts)
-        
+        embeddings = self.embedding_generator.generate_embeddings(
+            [doc["content"] for doc in chunked_documents]
+        )
+
+
+        # Store chunk content alongside its metadata so retrieval is a pure
+        # dict lookup instead of re-reading source files
+        for doc in chunked_documents:
+            doc["metadata"]["content"] = doc["content"]
+
         # Add to vector store
         self.logger.info("Adding to vector store...")
         self.vector_store.add_documents(chunked_documents, embeddings)
@@ -99,9 +103,30 @@ class CodePilot:
         # Generate response
         self.logger.info("Generating response...")
         response = self.response_generator.generate_response(query_text, retrieved_docs)
-        
+
         return response, retrieved_docs
 
+    def query_stream(self, query_text: str):
+        """Query the RAG system, streaming the response as it is generated.
+
+        Parameters
+        ----------
+        query_text : str
+            The query text to search for
+
+        Yields
+        ------
+        str
+            The next fragment of the generated response
+        """
+        # Retrieve relevant documents
+        self.logger.info("Retrieving relevant code...")
+        retrieved_docs = self.retriever.retrieve(query_text)
+
+        # Stream the response so output starts at the first token
+        self.logger.info("Generating response...")
+        yield from self.response_generator.generate_response_stream(query_text, retrieved_docs)
+
 
 def main():
     """Main entry point for the CLI application.
@@ -154,10 +179,11 @@ def main():
                 logger.info("User exited interactive mode")
                 break
             
-            response, _ = rag_system.query(query)
-            logger.info("Response generated successfully")
             print("\nResponse:")
-            print(response)
+            for token in rag_system.query_stream(query):
+                print(token, end="", flush=True)
+            print()
+            logger.info("Response generated successfully")
 
 
 if __name__ == "__main__":
@@ -4,15 +4,41 @@ class Config:
     # Document processing
     CHUNK_SIZE = 1000
     CHUNK_OVERLAP = 200
+    CHUNKER_BACKEND = "builtin"  # Options: builtin, langchain (Rust-backed splitters)
     
     # Vector store
     EMBEDDING_MODEL = "microsoft/codebert-base"  # Code-specific embedding model
+    EMBEDDING_PROVIDER = "huggingface"  # Options: huggingface, ollama
+    EMBEDDING_BACKEND = "torch"  # Options: torch (eager), compile (torch.compile), onnx (ONNX Runtime), ipex (Intel Extension for PyTorch)
+    USE_FP16 = True  # Half-precision inference when running on CUDA
+    USE_BF16 = True  # bfloat16 autocast on CPU where supported
+    POOLING = "mean"  # Options: mean (masked token average), cls (first token)
+    NUM_THREADS = None  # CPU threads for inference; None = autodetect
+    EMBED_BATCH_SIZE = 32  # Texts per model forward pass
     VECTOR_DIMENSION = 768
     INDEX_PATH = "faiss_index"
-    METADATA_PATH = "metadata.json"
+    METADATA_PATH = "metadata.pkl"
+    EMBEDDING_CACHE_DIR = "cache/emb"  # Relative to ~/.codepilot
+    METADATA_CACHE_PATH = "cache/metadata.pkl"  # Relative to ~/.codepilot
+    SAVE_EVERY = 0  # add_documents calls between automatic saves; 0 = only on flush()/exit
+    USE_GPU = False  # Move the FAISS index to GPU 0 when faiss-gpu is installed
+    MMAP_INDEX = False  # mmap the index file on load (read-only; query workloads)
+    FAISS_THREADS = None  # OpenMP threads for FAISS search; None = all cores
+    INDEX_TYPE = "flat"  # Options: flat, hnsw, ivfpq, ivfpqfs, sq8, ivfsq8
+    METRIC = "ip"        # Options: ip (cosine on normalized vectors), l2
+    HNSW_M = 32              # Graph links per node
+    HNSW_EF_CONSTRUCTION = 100  # Candidate-list size while building the graph
+    HNSW_EF_SEARCH = 64      # Candidate-list size at query time
+    IVF_NLIST = 100      # Number of IVF partitions (coarse clusters)
+    IVF_NPROBE = 8       # Number of partitions visited at search time
+    PQ_M = 48            # Product-quantizer sub-vectors (must divide VECTOR_DIMENSION)
+    PQ_NBITS = 8         # Bits per PQ sub-vector code
+    PQFS_M = 32          # Fast-scan sub-vectors (4-bit codes; must divide VECTOR_DIMENSION)
     
     # LLM
     OLLAMA_BASE_URL = "http://localhost:11434"
+    OLLAMA_CONNECT_TIMEOUT = 3.05  # Seconds to establish a connection
+    OLLAMA_READ_TIMEOUT = None  # Seconds to wait for a non-streaming response; None = unlimited
     MODEL_NAME = "codellama:7b"
     MAX_TOKENS = 2048
     TEMPERATURE = 0.1
@@ -48,6 +48,28 @@ class ResponseGenerator:
         
         return response
     
+    def generate_response_stream(self, query: str, retrieved_docs: List[Dict[str, Any]]):
+        """Stream a response based on the query and retrieved documents.
+
+        Parameters
+        ----------
+        query : str
+            The user's query text
+        retrieved_docs : List[Dict[str, Any]]
+            List of relevant documents with their content and metadata
+
+        Yields
+        ------
+        str
+            The next fragment of the generated response
+        """
+        if not retrieved_docs:
+            prompt = self.prompt_templates.create_no_context_prompt(query)
+        else:
+            prompt = self.prompt_templates.create_rag_prompt(query, retrieved_docs)
+
+        yield from self.llm_client.generate_stream(prompt)
+
     def _generate_no_context_response(self, query: str) -> str:
         """Generate a response when no relevant context is found.
         
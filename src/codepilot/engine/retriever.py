@@ -1,11 +1,34 @@
+import os
 import numpy as np
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from ..vector_db.faiss_store import FaissVectorStore
 from ..vector_db.embeddings import EmbeddingGenerator
 from ..config import Config
 from ..logging.logger import get_logger
 
 
+@lru_cache(maxsize=128)
+def _load_lines(file_path: str, mtime: float) -> Tuple[str, ...]:
+    """Read a source file once and cache its lines.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file to read
+    mtime : float
+        Modification time of the file; part of the cache key so the cache
+        is invalidated when the file changes
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The lines of the file, including line endings
+    """
+    with open(file_path, 'r') as f:
+        return tuple(f.readlines())
+
+
 class Retriever:
     """Retrieves relevant documents for a query.
     
@@ -26,7 +49,27 @@ class Retriever:
         self.logger = get_logger(__name__)
         self.vector_store = vector_store
         self.embedding_generator = embedding_generator
-    
+        # Resolve the default top_k once instead of on every retrieve call
+        self.top_k = Config.TOP_K
+        # Memoize query embeddings per instance; interactive sessions often
+        # repeat queries and the encoder forward pass dominates retrieval
+        self._embed_query = lru_cache(maxsize=256)(self._embed_query_uncached)
+
+    def _embed_query_uncached(self, query: str) -> bytes:
+        """Embed a query, returning the vector as hashable raw bytes.
+
+        Parameters
+        ----------
+        query : str
+            The query text to embed
+
+        Returns
+        -------
+        bytes
+            The float32 embedding vector as raw bytes
+        """
+        return self.embedding_generator.generate_embeddings([query]).tobytes()
+
     def retrieve(self, query: str, top_k: int = None) -> List[Dict[str, Any]]:
         """Retrieve relevant documents for the query.
         
@@ -42,11 +85,12 @@ class Retriever:
         List[Dict[str, Any]]
             List of relevant documents with their metadata and relevance scores
         """
-        if top_k is None:
-            top_k = Config.TOP_K
-        
-        # Generate embedding for the query
-        query_embedding = self.embedding_generator.generate_embeddings([query])
+        top_k = top_k or self.top_k
+
+        # Generate embedding for the query (cached for repeated queries)
+        query_embedding = np.frombuffer(
+            self._embed_query(query.strip()), dtype=np.float32
+        ).reshape(1, -1)
         
         # Search the vector store
         results = self.vector_store.search(query_embedding, top_k)
@@ -74,9 +118,14 @@ class Retriever:
             
             # Get content from the metadata
             content = self._get_content_from_metadata(metadata)
-            
-            # Calculate a relevance score (inverse of distance)
-            relevance_score = 1.0 / (1.0 + distance)
+
+            if Config.METRIC == "ip":
+                # Inner product over normalized embeddings is already a
+                # cosine similarity
+                relevance_score = float(distance)
+            else:
+                # Calculate a relevance score (inverse of distance)
+                relevance_score = 1.0 / (1.0 + distance)
             
             enriched_results.append({
                 "content": content,
@@ -85,9 +134,9 @@ class Retriever:
                 "relevance_score": relevance_score
             })
         
-        # Sort by relevance score (highest first)
-        enriched_results.sort(key=lambda x: x["relevance_score"], reverse=True)
-        
+        # FAISS already returns results in best-first order (ascending L2 /
+        # descending inner product), and both relevance transforms above are
+        # monotone in the raw score, so no re-sort is needed
         return enriched_results
     
     def _get_content_from_metadata(self, metadata: Dict[str, Any]) -> str:
@@ -114,8 +163,9 @@ class Retriever:
         if "line_range" in metadata:
             try:
                 start, end = metadata["line_range"]
-                with open(file_path, 'r') as f:
-                    lines = f.readlines()
+                # Cached per (path, mtime) so several chunks from the same
+                # file only read it once
+                lines = _load_lines(file_path, os.path.getmtime(file_path))
                 return ''.join(lines[start-1:end])
             except Exception as e:
                 self.logger.error(f"Error loading content from {file_path}: {e}")
@@ -1,5 +1,25 @@
 import json
 import requests
+from urllib3.util.retry import Retry
+
+try:
+    # orjson parses the per-token JSON objects of streaming responses
+    # several times faster than stdlib json
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 from typing import Dict, Any, List, Optional
 from ..config import Config
 from ..logging.logger import get_logger
@@ -25,9 +45,36 @@ class OllamaClient:
         self.logger = get_logger(__name__)
         self.base_url = base_url or Config.OLLAMA_BASE_URL
         self.model_name = model_name or Config.MODEL_NAME
-        
+
+        # Reuse one keep-alive session for all requests instead of opening a
+        # new TCP connection per call
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Connection setup fails fast, but with "stream": False the server
+        # sends nothing until the whole completion is generated, so the read
+        # timeout must cover the full generation (None = wait indefinitely)
+        self._timeout = (Config.OLLAMA_CONNECT_TIMEOUT, Config.OLLAMA_READ_TIMEOUT)
+
         # NOTE: Check if Ollama is running
         self.check_ollama_availability()
+
+        # Frozen request templates built once (after the availability check
+        # may have substituted the model name); per-call work is a dict
+        # spread plus one encode
+        self._base_generate = {
+            "model": self.model_name,
+            "temperature": Config.TEMPERATURE,
+            "num_predict": Config.MAX_TOKENS,
+            "stream": False
+        }
+        self._base_embed = {"model": Config.EMBEDDING_MODEL}
     
     def check_ollama_availability(self):
         """Check if Ollama is available and the model is loaded.
@@ -37,11 +84,11 @@ class OllamaClient:
         """
         try:
             # Check server is running
-            response = requests.get(f"{self.base_url}/api/tags")
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=(3.05, 30))
             response.raise_for_status()
             
             # Check if our model is available
-            models = response.json().get("models", [])
+            models = _loads(response.content).get("models", [])
             model_names = [model.get("name") for model in models]
             
             if self.model_name not in model_names:
@@ -75,24 +122,64 @@ class OllamaClient:
             The generated text response
         """
         url = f"{self.base_url}/api/generate"
-        
-        params = {
-            "model": self.model_name,
-            "prompt": prompt,
-            "temperature": temperature if temperature is not None else Config.TEMPERATURE,
-            "num_predict": max_tokens if max_tokens is not None else Config.MAX_TOKENS,
-            "stream": False
-        }
-        
+
+        params = {**self._base_generate, "prompt": prompt}
+        if temperature is not None:
+            params["temperature"] = temperature
+        if max_tokens is not None:
+            params["num_predict"] = max_tokens
+
         try:
             self.logger.debug(f"Sending request to {url} with model {self.model_name}")
-            response = requests.post(url, json=params)
+            response = self._session.post(url, data=_dumps(params), headers=_JSON_HEADERS, timeout=self._timeout)
             response.raise_for_status()
-            return response.json().get("response", "")
+            return _loads(response.content).get("response", "")
         except Exception as e:
             self.logger.error(f"Error generating text: {e}")
             return f"Error: Failed to generate response from Ollama: {str(e)}"
     
+    def generate_stream(self, prompt: str, temperature: float = None, max_tokens: int = None):
+        """Stream a text completion from Ollama token by token.
+
+        Parameters
+        ----------
+        prompt : str
+            The input prompt to generate text from
+        temperature : float, optional
+            Sampling temperature for generation
+        max_tokens : int, optional
+            Maximum number of tokens to generate
+
+        Yields
+        ------
+        str
+            The next fragment of the generated response
+        """
+        url = f"{self.base_url}/api/generate"
+
+        params = {**self._base_generate, "prompt": prompt, "stream": True}
+        if temperature is not None:
+            params["temperature"] = temperature
+        if max_tokens is not None:
+            params["num_predict"] = max_tokens
+
+        try:
+            self.logger.debug(f"Sending streaming request to {url} with model {self.model_name}")
+            with self._session.post(url, data=_dumps(params), headers=_JSON_HEADERS, timeout=(3.05, 120), stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    obj = _loads(line)
+                    token = obj.get("response", "")
+                    if token:
+                        yield token
+                    if obj.get("done"):
+                        break
+        except Exception as e:
+            self.logger.error(f"Error streaming text: {e}")
+            yield f"Error: Failed to generate response from Ollama: {str(e)}"
+
     def generate_chat(
         self, 
         messages: List[Dict[str, str]], 
@@ -116,24 +203,73 @@ class OllamaClient:
             The generated chat response text
         """
         url = f"{self.base_url}/api/chat"
-        
-        params = {
-            "model": self.model_name,
-            "messages": messages,
-            "temperature": temperature if temperature is not None else Config.TEMPERATURE,
-            "num_predict": max_tokens if max_tokens is not None else Config.MAX_TOKENS,
-            "stream": False
-        }
-        
+
+        params = {**self._base_generate, "messages": messages}
+        if temperature is not None:
+            params["temperature"] = temperature
+        if max_tokens is not None:
+            params["num_predict"] = max_tokens
+
         try:
             self.logger.debug(f"Sending chat request to {url} with model {self.model_name}")
-            response = requests.post(url, json=params)
+            response = self._session.post(url, data=_dumps(params), headers=_JSON_HEADERS, timeout=self._timeout)
             response.raise_for_status()
-            return response.json().get("message", {}).get("content", "")
+            return _loads(response.content).get("message", {}).get("content", "")
         except Exception as e:
             self.logger.error(f"Error generating chat response: {e}")
             return f"Error: Failed to generate chat response from Ollama: {str(e)}"
     
+    async def aget_embeddings(self, texts: List[str], concurrency: int = 16) -> List[List[float]]:
+        """Get embeddings for many texts concurrently.
+
+        Fires the `/api/embeddings` requests in parallel over a bounded
+        connection pool instead of one synchronous round-trip per text.
+
+        Parameters
+        ----------
+        texts : List[str]
+            The texts to generate embeddings for
+        concurrency : int, optional
+            Maximum number of concurrent requests
+
+        Returns
+        -------
+        List[List[float]]
+            One embedding vector per input text, in input order; failed
+            requests yield zero vectors
+        """
+        import asyncio
+        try:
+            import aiohttp
+        except ImportError as e:
+            # aiohttp is an extra (pip install codepilot[ollama]); without it
+            # fall back to one synchronous request per text
+            self.logger.warning(f"aiohttp not installed, fetching embeddings serially: {e}")
+            return [
+                self.get_embedding(text) or [0.0] * Config.VECTOR_DIMENSION
+                for text in texts
+            ]
+
+        url = f"{self.base_url}/api/embeddings"
+
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=concurrency)
+        ) as session:
+            async def fetch(text: str) -> List[float]:
+                params = {"model": Config.EMBEDDING_MODEL, "prompt": text}
+                try:
+                    async with session.post(url, json=params) as response:
+                        response.raise_for_status()
+                        data = await response.json()
+                        return data.get("embedding", [])
+                except Exception as e:
+                    self.logger.error(f"Error getting embedding: {e}")
+                    # Zero vector keeps the batch rectangular, matching the
+                    # failure behaviour of the local embedding path
+                    return [0.0] * Config.VECTOR_DIMENSION
+
+            return await asyncio.gather(*(fetch(text) for text in texts))
+
     def get_embedding(self, text: str) -> List[float]:
         """Get embedding for text from Ollama.
         
@@ -148,16 +284,13 @@ class OllamaClient:
             Vector embedding of the input text
         """
         url = f"{self.base_url}/api/embeddings"
-        
-        params = {
-            "model": Config.EMBEDDING_MODEL,
-            "prompt": text
-        }
-        
+
+        params = {**self._base_embed, "prompt": text}
+
         try:
-            response = requests.post(url, json=params)
+            response = self._session.post(url, data=_dumps(params), headers=_JSON_HEADERS, timeout=self._timeout)
             response.raise_for_status()
-            return response.json().get("embedding", [])
+            return _loads(response.content).get("embedding", [])
         except Exception as e:
             self.logger.error(f"Error getting embedding: {e}")
             return []
@@ -1,6 +1,58 @@
 from typing import List, Dict, Any
 
 
+# Static prompt skeletons are built once at import time; per-call work is a
+# single str.format instead of re-assembling the multi-line literals
+_RAG_TEMPLATE = """<instruction>
+You are an expert Python developer assistant. Your task is to answer questions about a Python codebase.
+You will be given:
+1. Retrieved code contexts from the codebase
+2. A question about the code
+
+Provide a helpful, accurate, and concise response. When referring to code, use code blocks.
+Focus on explaining the relevant parts of the code that answer the question.
+</instruction>
+
+<contexts>
+{contexts}
+</contexts>
+
+<question>
+{query}
+</question>
+
+<answer>
+"""
+
+_NO_CONTEXT_TEMPLATE = """<instruction>
+You are an expert Python developer assistant. Your task is to answer questions about Python programming.
+You've been asked a question, but no specific code context was found in the codebase.
+Provide a helpful, general response based on your knowledge of Python.
+</instruction>
+
+<question>
+{query}
+</question>
+
+<answer>
+"""
+
+_CODE_ANALYSIS_TEMPLATE = """<instruction>
+You are an expert Python developer assistant. Your task is to analyze the given Python code.
+Provide insights about:
+1. Purpose of the code
+2. Key functions and classes
+3. Potential bugs or improvements
+</instruction>
+
+<code>
+{code}
+</code>
+
+<analysis>
+"""
+
+
 class PromptTemplates:
     """XML-structured prompt templates for the LLM.
     
@@ -28,57 +80,39 @@ class PromptTemplates:
         
         for i, ctx in enumerate(retrieved_contexts, 1):
             metadata = ctx.get("metadata", {})
-            context_str = f"<context id='{i}'>\n"
-            
+            # Collect the pieces in a list and join once at the end, rather
+            # than growing a string with repeated concatenation
+            parts = [f"<context id='{i}'>\n"]
+
             # Add metadata
-            context_str += "<metadata>\n"
+            parts.append("<metadata>\n")
             file_path = metadata.get("file_path", "unknown")
-            context_str += f"File: {file_path}\n"
-            
+            parts.append(f"File: {file_path}\n")
+
             if "type" in metadata:
                 context_type = metadata["type"]
-                context_str += f"Type: {context_type}\n"
-                
+                parts.append(f"Type: {context_type}\n")
+
                 if context_type == "class":
-                    context_str += f"Class: {metadata.get('name', 'unknown')}\n"
+                    parts.append(f"Class: {metadata.get('name', 'unknown')}\n")
                 elif context_type == "function":
-                    context_str += f"Function: {metadata.get('name', 'unknown')}\n"
-            
-            context_str += "</metadata>\n\n"
-            
+                    parts.append(f"Function: {metadata.get('name', 'unknown')}\n")
+
+            parts.append("</metadata>\n\n")
+
             # Add code content
             if metadata.get("type") in ["class", "function"]:
-                context_str += "<code>\n"
-                context_str += ctx.get("content", "")
-                context_str += "\n</code>"
+                parts.append("<code>\n")
+                parts.append(ctx.get("content", ""))
+                parts.append("\n</code>")
             else:
-                context_str += ctx.get("content", "")
-            
-            context_str += "\n</context>"
-            formatted_contexts.append(context_str)
+                parts.append(ctx.get("content", ""))
+
+            parts.append("\n</context>")
+            formatted_contexts.append("".join(parts))
         
         joined_contexts = "\n\n".join(formatted_contexts)
-        prompt = f"""<instruction>
-You are an expert Python developer assistant. Your task is to answer questions about a Python codebase.
-You will be given:
-1. Retrieved code contexts from the codebase
-2. A question about the code
-
-Provide a helpful, accurate, and concise response. When referring to code, use code blocks.
-Focus on explaining the relevant parts of the code that answer the question.
-</instruction>
-
-<contexts>
-{joined_contexts}
-</contexts>
-
-<question>
-{query}
-</question>
-
-<answer>
-"""
-        return prompt
+        return _RAG_TEMPLATE.format(contexts=joined_contexts, query=query)
     
     @staticmethod
     def create_no_context_prompt(query: str) -> str:
@@ -94,19 +128,7 @@ Focus on explaining the relevant parts of the code that answer the question.
         str
             Formatted prompt for queries without context
         """
-        prompt = f"""<instruction>
-You are an expert Python developer assistant. Your task is to answer questions about Python programming.
-You've been asked a question, but no specific code context was found in the codebase.
-Provide a helpful, general response based on your knowledge of Python.
-</instruction>
-
-<question>
-{query}
-</question>
-
-<answer>
-"""
-        return prompt
+        return _NO_CONTEXT_TEMPLATE.format(query=query)
     
     @staticmethod
     def create_code_analysis_prompt(code: str) -> str:
@@ -122,18 +144,4 @@ Provide a helpful, general response based on your knowledge of Python.
         str
             Formatted prompt for code analysis
         """
-        prompt = f"""<instruction>
-You are an expert Python developer assistant. Your task is to analyze the given Python code.
-Provide insights about:
-1. Purpose of the code
-2. Key functions and classes
-3. Potential bugs or improvements
-</instruction>
-
-<code>
-{code}
-</code>
-
-<analysis>
-"""
-        return prompt
\ No newline at end of file
+        return _CODE_ANALYSIS_TEMPLATE.format(code=code)
\ No newline at end of file
@@ -1,14 +1,148 @@
+import atexit
 import logging
 import os
-import inspect
+import queue
 import sys
-import datetime
+import threading
+import time
 import json
+from functools import lru_cache
 from typing import Dict, Any, Optional, Union, List
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import (
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+    QueueHandler,
+    QueueListener,
+)
 from pathlib import Path
 from ..config import Config
 
+try:
+    # orjson serializes log records 2-4x faster than stdlib json
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data, default=str).decode()
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data, default=str)
+
+
+# Log directories already created this process; skips the per-component
+# stat syscalls os.makedirs pays on every logger construction
+_ensured_dirs = set()
+
+
+def _ensure_dir(log_dir: str):
+    """Create a log directory once per process."""
+    if log_dir and log_dir not in _ensured_dirs:
+        os.makedirs(log_dir, exist_ok=True)
+        _ensured_dirs.add(log_dir)
+
+
+class ClassNameFilter(logging.Filter):
+    """Filter that attaches the calling class name to log records.
+
+    Resolves the caller's class with a bounded `sys._getframe` walk that
+    skips logging-machinery frames, which is far cheaper per record than
+    the `inspect` module.
+    """
+
+    _MAX_FRAMES = 12
+
+    def filter(self, record):
+        """Set `className` on the record if not already present.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            The log record to annotate
+
+        Returns
+        -------
+        bool
+            Always True; the record is never dropped
+        """
+        if hasattr(record, 'className'):
+            return True
+
+        class_name = 'None'
+        try:
+            frame = sys._getframe(1)
+            for _ in range(self._MAX_FRAMES):
+                if frame is None:
+                    break
+                module = frame.f_globals.get('__name__', '')
+                # Skip stdlib logging internals and this module's wrappers
+                if module != 'logging' and module != __name__:
+                    caller_self = frame.f_locals.get('self')
+                    if caller_self is not None:
+                        class_name = type(caller_self).__name__
+                        break
+                frame = frame.f_back
+        except Exception:
+            class_name = 'Unknown'
+
+        record.className = class_name
+        return True
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler tuned for high record rates.
+
+    The plain `RotatingFileHandler` pays a seek/tell size check on every
+    record and writes with the default small buffer. This variant opens the
+    stream with a 64 KiB buffer, re-checks the file size only every
+    `_CHECK_INTERVAL` records (via `os.fstat` after a flush), and flushes
+    the buffer from a periodic daemon timer so records still reach disk
+    promptly during quiet periods. Rotation may overshoot `maxBytes` by up
+    to `_CHECK_INTERVAL` records, which is harmless for log files.
+    """
+
+    _CHECK_INTERVAL = 128
+    _FLUSH_INTERVAL = 5.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._records_since_check = 0
+        self._flush_timer = None
+        self._schedule_flush()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=65536,
+                    encoding=self.encoding, errors=self.errors)
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return False
+        self._records_since_check += 1
+        if self._records_since_check < self._CHECK_INTERVAL:
+            return False
+        self._records_since_check = 0
+        if self.stream is None:
+            self.stream = self._open()
+        # fstat only sees flushed bytes, so push the buffer out first
+        self.stream.flush()
+        return os.fstat(self.stream.fileno()).st_size >= self.maxBytes
+
+    def _schedule_flush(self):
+        self._flush_timer = threading.Timer(self._FLUSH_INTERVAL, self._periodic_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _periodic_flush(self):
+        try:
+            self.flush()
+        except ValueError:
+            # Stream already closed
+            return
+        self._schedule_flush()
+
+    def close(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        super().close()
+
 
 class CustomFormatter(logging.Formatter):
     """Custom formatter that allows flexible formatting with various components.
@@ -45,6 +179,12 @@ class CustomFormatter(logging.Formatter):
     def __init__(self, fmt=None, datefmt=None, style='%', validate=True, include_class_name=True):
         super().__init__(fmt, datefmt, style, validate)
         self.include_class_name = include_class_name
+        # Memoized (second, datefmt) -> formatted string; log bursts within
+        # the same second reuse the stamp without re-running strftime
+        self._time_cache = (None, None, "")
+        # Whether the format string references asctime, resolved once here
+        # instead of per record
+        self._uses_time = self.usesTime()
 
     def formatTime(self, record, datefmt=None):
         """Override to provide more detailed timestamp formatting.
@@ -61,41 +201,43 @@ class CustomFormatter(logging.Formatter):
         str
             Formatted timestamp
         """
+        sec = int(record.created)
+        cached_sec, cached_fmt, cached_stamp = self._time_cache
+        if sec != cached_sec or datefmt != cached_fmt:
+            cached_stamp = time.strftime(datefmt or "%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+            self._time_cache = (sec, datefmt, cached_stamp)
+
         if datefmt:
-            return datetime.datetime.fromtimestamp(record.created).strftime(datefmt)
-        else:
-            return datetime.datetime.fromtimestamp(record.created).isoformat()
+            return cached_stamp
+        # Preserve the isoformat-style microsecond suffix of the default path
+        return f"{cached_stamp}.{int((record.created - sec) * 1_000_000):06d}"
 
     def format(self, record):
-        """Add class name to the record if available and requested.
-        
+        """Format the record, taking a fast path for plain records.
+
+        `className` is attached by `ClassNameFilter` before the record
+        reaches any formatter, so no per-record attribute check is needed
+        here. Records without exception or stack information skip the base
+        `Formatter.format` and go straight through the precompiled style.
+
         Parameters
         ----------
         record : logging.LogRecord
             The log record to format
-            
+
         Returns
         -------
         str
             Formatted log record
         """
-        if self.include_class_name and not hasattr(record, 'className'):
-            frame = inspect.currentframe()
-            try:
-                frame = frame.f_back
-                while frame:
-                    if 'self' in frame.f_locals:
-                        record.className = frame.f_locals['self'].__class__.__name__
-                        break
-                    frame = frame.f_back
-                else:
-                    record.className = 'None'
-            except Exception:
-                record.className = 'Unknown'
-            finally:
-                del frame
+        if record.exc_info or record.exc_text or record.stack_info:
+            # Rare records carrying tracebacks take the full base path
+            return super().format(record)
 
-        return super().format(record)
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        return self._style.format(record)
 
 
 class JSONFormatter(logging.Formatter):
@@ -110,7 +252,12 @@ class JSONFormatter(logging.Formatter):
     """
     def __init__(self, fields: Optional[List[str]] = None, time_format: str = '%Y-%m-%d %H:%M:%S'):
         self.fields = fields
+        # With an explicit field list the record schema is fixed, so the
+        # attribute names to emit can be precomputed once
+        self._fields = tuple(fields) if fields else None
         self.time_format = time_format
+        # Memoized second -> formatted timestamp (see CustomFormatter)
+        self._time_cache = (None, "")
         super().__init__()
 
     def format(self, record):
@@ -127,21 +274,62 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log record
         """
         log_data = {}
-        
-        for attr in record.__dict__:
-            if not attr.startswith('_') and (not self.fields or attr in self.fields):
-                if attr == 'created':
-                    log_data['timestamp'] = datetime.datetime.fromtimestamp(
-                        record.created).strftime(self.time_format)
-                elif attr == 'exc_info' and record.exc_info:
-                    log_data['exception'] = self.formatException(record.exc_info)
-                else:
-                    log_data[attr] = getattr(record, attr)
+
+        # A fixed field list avoids scanning the whole record __dict__
+        attrs = self._fields if self._fields is not None else record.__dict__
+
+        for attr in attrs:
+            if attr.startswith('_'):
+                continue
+            if attr == 'created':
+                sec = int(record.created)
+                cached_sec, cached_stamp = self._time_cache
+                if sec != cached_sec:
+                    cached_stamp = time.strftime(self.time_format, time.localtime(sec))
+                    self._time_cache = (sec, cached_stamp)
+                log_data['timestamp'] = cached_stamp
+            elif attr == 'exc_info' and record.exc_info:
+                log_data['exception'] = self.formatException(record.exc_info)
+            else:
+                log_data[attr] = getattr(record, attr, None)
 
         if hasattr(record, 'className'):
             log_data['className'] = record.className
-            
-        return json.dumps(log_data)
+
+        return _json_dumps(log_data)
+
+
+@lru_cache(maxsize=16)
+def _build_formatter(log_as_json: bool, fmt: str, datefmt: str,
+                     include_class_name: bool, json_fields: Optional[tuple]):
+    """Build (or reuse) a formatter for the given configuration.
+
+    `get_logger` is called once per module and most loggers share the same
+    format settings, so identical formatters are constructed once and
+    shared across handlers; formatters are stateless per record and safe
+    to share.
+
+    Parameters
+    ----------
+    log_as_json : bool
+        Whether to use JSON formatting
+    fmt : str
+        Format string for log records
+    datefmt : str
+        Format string for timestamps
+    include_class_name : bool
+        Whether to include the class name in logs
+    json_fields : tuple, optional
+        Fields to include in JSON output
+
+    Returns
+    -------
+    logging.Formatter
+        The configured formatter
+    """
+    if log_as_json:
+        return JSONFormatter(fields=list(json_fields) if json_fields else None, time_format=datefmt)
+    return CustomFormatter(fmt=fmt, datefmt=datefmt, include_class_name=include_class_name)
 
 
 class CodePilotLogger:
@@ -212,7 +400,10 @@ class CodePilotLogger:
         self.format_str = format_str or self.DEFAULT_FORMAT
         self.date_format = date_format or self.DEFAULT_DATE_FORMAT
         self.include_class_name = include_class_name
-        
+        # Queue listener that drains file-handler writes off the hot path;
+        # created lazily by _attach_async when the first file handler is added
+        self._listener = None
+
         # Get or create the logger
         self.logger = logging.getLogger(self.name)
         self.logger.setLevel(self.level)
@@ -221,7 +412,15 @@ class CodePilotLogger:
         # Remove existing handlers if any
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
-        
+
+        # Resolve the caller class once per record via a filter instead of a
+        # frame walk inside the formatter
+        if include_class_name:
+            for log_filter in self.logger.filters[:]:
+                if isinstance(log_filter, ClassNameFilter):
+                    self.logger.removeFilter(log_filter)
+            self.logger.addFilter(ClassNameFilter())
+
         # Configure handlers
         if log_to_console:
             self._add_console_handler(log_as_json, json_fields)
@@ -230,10 +429,37 @@ class CodePilotLogger:
             if log_file is None:
                 # Default log file path
                 log_dir = os.path.join(os.path.expanduser("~"), ".codepilot", "logs")
-                os.makedirs(log_dir, exist_ok=True)
+                _ensure_dir(log_dir)
                 log_file = os.path.join(log_dir, f"{self.name}.log")
             self._add_file_handler(log_file, max_file_size, backup_count, log_as_json, json_fields)
     
+    def _attach_async(self, handler: logging.Handler):
+        """Route a handler's writes through a background queue listener.
+
+        Logging calls then only enqueue the record, so the application
+        thread never blocks on the handler's disk writes; a single daemon
+        thread drains the queue and performs the actual I/O.
+
+        Parameters
+        ----------
+        handler : logging.Handler
+            The handler whose emit should run off the calling thread
+        """
+        if self._listener is None:
+            log_queue = queue.Queue(-1)
+            self.logger.addHandler(QueueHandler(log_queue))
+            self._listener = QueueListener(log_queue, handler, respect_handler_level=True)
+            self._listener.start()
+            atexit.register(self._stop_listener)
+        else:
+            # Subsequent handlers share the existing queue and thread
+            self._listener.handlers += (handler,)
+
+    def _stop_listener(self):
+        """Flush and stop the queue listener; safe to call more than once."""
+        if self._listener is not None and self._listener._thread is not None:
+            self._listener.stop()
+
     def _get_log_level(self, level: str) -> int:
         """Convert a string log level to its numeric value.
         
@@ -264,14 +490,13 @@ class CodePilotLogger:
         logging.Formatter
             The configured formatter
         """
-        if log_as_json:
-            return JSONFormatter(fields=json_fields, time_format=self.date_format)
-        else:
-            return CustomFormatter(
-                fmt=self.format_str,
-                datefmt=self.date_format,
-                include_class_name=self.include_class_name
-            )
+        return _build_formatter(
+            log_as_json,
+            self.format_str,
+            self.date_format,
+            self.include_class_name,
+            tuple(json_fields) if json_fields else None,
+        )
     
     def _add_console_handler(self, log_as_json: bool, json_fields: List[str] = None):
         """Add a console handler to the logger.
@@ -312,18 +537,17 @@ class CodePilotLogger:
             Fields to include in JSON output
         """
         # Ensure directory exists
-        log_dir = os.path.dirname(log_file)
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # Create a rotating file handler
-        file_handler = RotatingFileHandler(
+        _ensure_dir(os.path.dirname(log_file))
+
+        # Create a rotating file handler with buffered writes
+        file_handler = BufferedRotatingFileHandler(
             log_file,
             maxBytes=max_file_size,
             backupCount=backup_count
         )
         file_handler.setLevel(self.level)
         file_handler.setFormatter(self._create_formatter(log_as_json, json_fields))
-        self.logger.addHandler(file_handler)
+        self._attach_async(file_handler)
     
     def add_daily_file_handler(
         self,
@@ -346,9 +570,8 @@ class CodePilotLogger:
             Fields to include in JSON output
         """
         # Ensure directory exists
-        log_dir = os.path.dirname(log_file)
-        os.makedirs(log_dir, exist_ok=True)
-        
+        _ensure_dir(os.path.dirname(log_file))
+
         # Create a timed rotating file handler
         handler = TimedRotatingFileHandler(
             log_file,
@@ -359,7 +582,7 @@ class CodePilotLogger:
         handler.setLevel(self.level)
         handler.setFormatter(self._create_formatter(log_as_json, json_fields))
         handler.suffix = "%Y-%m-%d"
-        self.logger.addHandler(handler)
+        self._attach_async(handler)
     
     def debug(self, msg, *args, **kwargs):
         """Log a debug message.
@@ -447,6 +670,21 @@ class CodePilotLogger:
         """
         self.logger.exception(msg, *args, exc_info=exc_info, **kwargs)
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether this logger would process a record of the given level.
+
+        Parameters
+        ----------
+        level : int
+            Numeric log level to test
+
+        Returns
+        -------
+        bool
+            True if records of this level would be processed
+        """
+        return self.logger.isEnabledFor(level)
+
     def set_level(self, level: Union[str, int]):
         """Set the logging level.
         
@@ -460,6 +698,10 @@ class CodePilotLogger:
         self.logger.setLevel(level)
         for handler in self.logger.handlers:
             handler.setLevel(level)
+        if self._listener is not None:
+            # Handlers owned by the queue listener are not on the logger
+            for handler in self._listener.handlers:
+                handler.setLevel(level)
 
 
 # Create a default logger instance
@@ -472,14 +714,18 @@ default_logger = CodePilotLogger(
 )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> CodePilotLogger:
     """Get a logger instance with the specified name.
-    
+
+    Cached per name so repeated calls (typically one per module import)
+    reuse the already-configured instance instead of rebuilding handlers.
+
     Parameters
     ----------
     name : str
         The name for the logger, typically __name__
-        
+
     Returns
     -------
     CodePilotLogger
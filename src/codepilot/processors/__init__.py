@@ -1,3 +1,4 @@
 from .ast_parser import AstParser
 from .chunker import Chunker
-from .metadata_extractor import MetadataExtractor
\ No newline at end of file
+from .metadata_extractor import MetadataExtractor
+from .pipeline import Pipeline
\ No newline at end of file
@@ -1,29 +1,223 @@
 import ast
+import io
+import logging
 import os
-from typing import Dict, List, Tuple, Any
+import sys
+import tokenize
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from ..logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Cached once at import: skips both the f-string formatting and the logging
+# machinery for the very frequent per-file/per-node debug calls when DEBUG
+# is disabled
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
 
-class NodeVisitor(ast.NodeVisitor):
-    """AST node visitor that adds parent references to all nodes.
+# Minimum number of files before parsing is farmed out to worker processes;
+# below this the process-spawn overhead outweighs the parallelism
+_PARALLEL_THRESHOLD = 32
 
-    This visitor traverses the AST and adds a parent reference
-    to each node, enabling bottom-up traversal.
+# Directories never worth descending into; frozenset membership on the entry
+# name avoids splitting the full path per directory
+_SKIP_DIRS = frozenset({'env', 'venv', '.venv', '.git', '__pycache__', 'node_modules', '.tox'})
+
+# Identifier names (methods, arguments, bases) repeat heavily across a
+# codebase; memoizing them makes every document share one str object per
+# distinct name instead of carrying its own copy
+_str_memo: Dict[str, str] = {}
+
+
+def _intern(s: str) -> str:
+    return _str_memo.setdefault(s, s)
+
+
+def _docstring(node) -> str:
+    """Return a definition's docstring, or an empty string.
+
+    Inlined first-statement check; `ast.get_docstring` additionally runs
+    `inspect.cleandoc` per node, which the raw indexed text does not need.
+
+    Parameters
+    ----------
+    node : ast.AST
+        A class or function definition node
+
+    Returns
+    -------
+    str
+        The docstring text, or "" when the node has none
     """
-    
-    def visit(self, node):
-        """Visit a node and set its parent for all its children.
-        
-        Parameters
-        ----------
-        node : ast.AST
-            The node to visit
-        """
-        for child in ast.iter_child_nodes(node):
-            child.parent = node
-            self.visit(child)
+    body = node.body
+    if body and isinstance(body[0], ast.Expr):
+        value = body[0].value
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return value.value
+    return ""
+
+
+def _parse_file_worker(file_path: str) -> "ParsedChunks":
+    """Parse one file in a worker process.
+
+    Module-level so it is picklable by ProcessPoolExecutor.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the Python file to parse
+
+    Returns
+    -------
+    ParsedChunks
+        Document chunks extracted from the file, empty on error
+    """
+    try:
+        return AstParser().parse_file(file_path)
+    except Exception as e:
+        logger.error(f"Error parsing {file_path}: {str(e)}", exc_info=True)
+        return ParsedChunks()
+
+
+class Chunk:
+    """Slotted per-chunk view with mapping-style access.
+
+    Replaces the nested ``{"content": ..., "metadata": {...}}`` dicts that
+    were built per chunk; a slots instance carries no instance ``__dict__``,
+    so thousands of views cost a fraction of the memory. Subscript access
+    is kept so downstream consumers keep using ``doc["content"]`` and
+    ``doc["metadata"]`` unchanged.
+    """
+
+    __slots__ = ("content", "metadata")
+
+    def __init__(self, content: str, metadata: Dict[str, Any]):
+        self.content = content
+        self.metadata = metadata
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def __repr__(self) -> str:
+        return f"Chunk(content={self.content!r:.40}, metadata={self.metadata!r})"
+
+
+@dataclass
+class ParsedChunks:
+    """Columnar storage for parsed document chunks.
+
+    Chunks are stored as parallel columns (struct-of-arrays) instead of one
+    dict per chunk, which removes the per-dict overhead that dominates
+    memory on large repositories. Line numbers live in compact ``array('i')``
+    columns. Iteration and indexing build the familiar document dicts on
+    demand, so downstream consumers are unchanged.
+    """
+
+    contents: List[str] = field(default_factory=list)
+    file_paths: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    names: List[Optional[str]] = field(default_factory=list)
+    docstrings: List[Optional[str]] = field(default_factory=list)
+    line_starts: array = field(default_factory=lambda: array('i'))
+    line_ends: array = field(default_factory=lambda: array('i'))
+    # Ragged per-chunk columns; None where a column does not apply
+    methods: List[Optional[List[str]]] = field(default_factory=list)
+    bases: List[Optional[List[str]]] = field(default_factory=list)
+    arguments: List[Optional[List[str]]] = field(default_factory=list)
+
+    def append(
+        self,
+        content: str,
+        file_path: str,
+        type_: str,
+        name: Optional[str] = None,
+        docstring: Optional[str] = None,
+        line_start: int = 0,
+        line_end: int = 0,
+        methods: Optional[List[str]] = None,
+        bases: Optional[List[str]] = None,
+        arguments: Optional[List[str]] = None,
+    ):
+        """Append one chunk to the columns."""
+        self.contents.append(content)
+        self.file_paths.append(file_path)
+        self.types.append(type_)
+        self.names.append(name)
+        self.docstrings.append(docstring)
+        self.line_starts.append(line_start)
+        self.line_ends.append(line_end)
+        self.methods.append(methods)
+        self.bases.append(bases)
+        self.arguments.append(arguments)
+
+    def extend(self, other: "ParsedChunks"):
+        """Append all chunks from another ParsedChunks."""
+        self.contents.extend(other.contents)
+        self.file_paths.extend(other.file_paths)
+        self.types.extend(other.types)
+        self.names.extend(other.names)
+        self.docstrings.extend(other.docstrings)
+        self.line_starts.extend(other.line_starts)
+        self.line_ends.extend(other.line_ends)
+        self.methods.extend(other.methods)
+        self.bases.extend(other.bases)
+        self.arguments.extend(other.arguments)
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    def __getitem__(self, index: int) -> Chunk:
+        """Build the document view for one chunk on demand."""
+        type_ = self.types[index]
+        metadata: Dict[str, Any] = {
+            "file_path": self.file_paths[index],
+            "type": type_,
+        }
+        if type_ != "raw_text":
+            metadata["name"] = self.names[index]
+            metadata["docstring"] = self.docstrings[index]
+            if type_ == "class":
+                metadata["methods"] = self.methods[index]
+                metadata["bases"] = self.bases[index]
+            elif type_ == "function":
+                metadata["arguments"] = self.arguments[index]
+            metadata["line_range"] = (self.line_starts[index], self.line_ends[index])
+        return Chunk(self.contents[index], metadata)
+
+    def __iter__(self) -> Iterator[Chunk]:
+        for index in range(len(self.contents)):
+            yield self[index]
+
+
+class _DefinitionCollector(ast.NodeVisitor):
+    """Collect class and top-level function definitions in a single pass.
+
+    Tracks nesting depth while visiting so top-level functions are
+    identified directly, without a separate parent-annotation traversal.
+    """
+
+    def __init__(self):
+        self.classes = []
+        self.functions = []
+        self._depth = 0
+
+    def visit_ClassDef(self, node):
+        self.classes.append(node)
+        self._depth += 1
+        self.generic_visit(node)
+        self._depth -= 1
+
+    def visit_FunctionDef(self, node):
+        if self._depth == 0:
+            self.functions.append(node)
+        self._depth += 1
+        self.generic_visit(node)
+        self._depth -= 1
 
 
 class AstParser:
@@ -38,7 +232,7 @@ class AstParser:
         self.files_parsed = 0
         logger.debug("Initialized AstParser")
     
-    def parse_directory(self, directory_path: str) -> List[Dict[str, Any]]:
+    def parse_directory(self, directory_path: str) -> ParsedChunks:
         """Parse all Python files in a directory and its subdirectories.
 
         Parameters
@@ -48,179 +242,210 @@ class AstParser:
 
         Returns
         -------
-        List[Dict[str, Any]]
-            List of document chunks with metadata extracted from Python files
+        ParsedChunks
+            Columnar collection of document chunks extracted from Python
+            files; iterating it yields the per-chunk document dicts
         """
-        documents = []
-        skipped_dirs = 0
-        
+        documents = ParsedChunks()
+
         logger.info(f"Starting to parse Python files in directory: {directory_path}")
-        
-        for root, _, files in os.walk(directory_path):
-            # NOTE: Skip virtual environment directories (still could be improved to avoid unreleated directories)
-            if "env" in root.split(os.path.sep) or "venv" in root.split(os.path.sep):
-                skipped_dirs += 1
-                logger.debug(f"Skipping virtual environment directory: {root}")
-                continue
-                
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        file_documents = self.parse_file(file_path)
-                        documents.extend(file_documents)
-                        self.files_parsed += 1
-                        logger.debug(f"Successfully parsed {file_path}, extracted {len(file_documents)} document chunks")
-                    except Exception as e:
-                        logger.error(f"Error parsing {file_path}: {str(e)}", exc_info=True)
-        
-        logger.info(f"Successfully parsed {self.files_parsed} Python files, skipped {skipped_dirs} directories")
+
+        file_paths = self.list_files(directory_path)
+
+        if len(file_paths) >= _PARALLEL_THRESHOLD:
+            # Parsing is pure CPU work and independent per file, so it scales
+            # nearly linearly across processes
+            max_workers = min(os.cpu_count() or 1, len(file_paths))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for file_documents in executor.map(_parse_file_worker, file_paths, chunksize=16):
+                    documents.extend(file_documents)
+                    self.files_parsed += 1
+        else:
+            for file_path in file_paths:
+                try:
+                    file_documents = self.parse_file(file_path)
+                    documents.extend(file_documents)
+                    self.files_parsed += 1
+                    # One periodic summary instead of a record per file
+                    if _DEBUG and self.files_parsed % 100 == 0:
+                        logger.debug("Parsed %d/%d files, %d chunks so far", self.files_parsed, len(file_paths), len(documents))
+                except Exception as e:
+                    logger.error(f"Error parsing {file_path}: {str(e)}", exc_info=True)
+
+        logger.info(f"Successfully parsed {self.files_parsed} Python files")
         return documents
-    
-    def parse_file(self, file_path: str) -> List[Dict[str, Any]]:
+
+    def list_files(self, directory_path: str) -> List[str]:
+        """Collect the Python files under a directory.
+
+        Parameters
+        ----------
+        directory_path : str
+            Path to the directory to scan
+
+        Returns
+        -------
+        List[str]
+            Paths of the Python files to parse
+        """
+        file_paths = []
+        skipped_dirs = 0
+
+        # Manual scandir walk: DirEntry carries the file type from the
+        # directory listing itself, so no extra stat per entry, and skipped
+        # directories are pruned before they are ever listed
+        stack = [directory_path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name in _SKIP_DIRS:
+                                skipped_dirs += 1
+                                if _DEBUG:
+                                    logger.debug("Skipping directory: %s", entry.path)
+                            else:
+                                stack.append(entry.path)
+                        elif entry.name.endswith('.py'):
+                            file_paths.append(entry.path)
+            except OSError as e:
+                logger.warning(f"Could not scan directory {current}: {e}")
+
+        if _DEBUG:
+            logger.debug("Found %d Python files, skipped %d directories", len(file_paths), skipped_dirs)
+        return file_paths
+
+    def parse_file(self, file_path: str) -> ParsedChunks:
         """Parse a single Python file into document chunks with metadata.
-        
+
         Parameters
         ----------
         file_path : str
             Path to the Python file to parse
-            
+
         Returns
         -------
-        List[Dict[str, Any]]
-            List of document chunks with metadata extracted from the file
+        ParsedChunks
+            Columnar collection of document chunks extracted from the file
         """
-        logger.debug(f"Parsing file: {file_path}")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
+        # Interned once so every document from this file shares one string
+        file_path = sys.intern(file_path)
+
+        # Read raw bytes once; the C parser consumes bytes natively (honoring
+        # PEP 263 encoding cookies), so no Python-level decode on its path
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+
+        # Decode once for line slicing, with the file's declared encoding
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(raw).readline)
+        content = raw.decode(encoding)
+
         # Parse the AST
         try:
-            tree = ast.parse(content)
-            # Add parent references to nodes
-            visitor = NodeVisitor()
-            tree.parent = None  # Root node has no parent
-            visitor.visit(tree)
-            logger.debug(f"Successfully created AST for {file_path}")
+            tree = ast.parse(raw, filename=file_path)
         except SyntaxError as e:
             # Fall back to raw text if AST parsing fails
             logger.warning(f"Syntax error in {file_path}: {str(e)}. Falling back to raw text.")
-            return [{"content": content, "metadata": {"file_path": file_path, "type": "raw_text"}}]
-        
-        documents = []
-        class_count = 0
-        function_count = 0
-        
-        # Process each node in the AST
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                documents.append(self._process_class(node, file_path, content))
-                class_count += 1
-            elif isinstance(node, ast.FunctionDef):
-                # Only include top-level functions
-                try:
-                    if hasattr(node, 'parent') and isinstance(node.parent, ast.Module):
-                        documents.append(self._process_function(node, file_path, content))
-                        function_count += 1
-                except AttributeError:
-                    # Skip if there's an issue with the parent attribute
-                    logger.debug(f"Skipping function {getattr(node, 'name', 'unknown')} due to missing parent attribute")
-                    continue
-        
-        logger.debug(f"Extracted {class_count} classes and {function_count} top-level functions from {file_path}")
+            documents = ParsedChunks()
+            documents.append(content, file_path, "raw_text")
+            return documents
+
+        # Collect all classes and top-level functions in one traversal
+        collector = _DefinitionCollector()
+        collector.visit(tree)
+
+        # Split the source into lines once; every class and function slices
+        # this list instead of re-splitting the full file text
+        lines = content.split('\n')
+
+        documents = ParsedChunks()
+        for node in collector.classes:
+            self._process_class(node, file_path, lines, documents)
+        for node in collector.functions:
+            self._process_function(node, file_path, lines, documents)
+
+        if _DEBUG:
+            logger.debug("Extracted %d classes and %d top-level functions from %s",
+                         len(collector.classes), len(collector.functions), file_path)
         return documents
     
-    def _process_class(self, node: ast.ClassDef, file_path: str, content: str) -> Dict[str, Any]:
-        """Process a class definition node.
-        
+    def _process_class(self, node: ast.ClassDef, file_path: str, lines: List[str], documents: ParsedChunks):
+        """Process a class definition node and append it to the chunks.
+
         Parameters
         ----------
         node : ast.ClassDef
             The class definition node from the AST
         file_path : str
             Path to the file containing the class
-        content : str
-            Source code of the file
-            
-        Returns
-        -------
-        Dict[str, Any]
-            Document chunk with metadata about the class
+        lines : List[str]
+            Source code of the file, pre-split into lines
+        documents : ParsedChunks
+            Columnar collection the chunk is appended to
         """
-        # Get the source code
+        # Get the source code; end_lineno already spans the whole definition
         start_line = node.lineno
-        end_line = max(child.end_lineno for child in ast.walk(node) if hasattr(child, 'end_lineno')) \
-                  if hasattr(node, 'end_lineno') else start_line
-        
-        class_source = '\n'.join(content.split('\n')[start_line-1:end_line])
+        end_line = getattr(node, 'end_lineno', None) or start_line
+
+        class_source = '\n'.join(lines[start_line-1:end_line])
         
         # Extract docstring
-        docstring = ast.get_docstring(node) or ""
+        docstring = _docstring(node)
         
         # Extract methods
         methods = []
         for child in node.body:
             if isinstance(child, ast.FunctionDef):
-                methods.append(child.name)
+                methods.append(_intern(child.name))
         
-        logger.debug(f"Processed class {node.name} from {file_path} (lines {start_line}-{end_line}) with {len(methods)} methods")
-        
-        return {
-            "content": class_source,
-            "metadata": {
-                "file_path": file_path,
-                "type": "class",
-                "name": node.name,
-                "docstring": docstring,
-                "methods": methods,
-                "bases": [base.id for base in node.bases if isinstance(base, ast.Name)],
-                "line_range": (start_line, end_line)
-            }
-        }
+        documents.append(
+            class_source,
+            file_path,
+            "class",
+            name=node.name,
+            docstring=docstring,
+            line_start=start_line,
+            line_end=end_line,
+            methods=methods,
+            bases=[_intern(base.id) for base in node.bases if isinstance(base, ast.Name)],
+        )
     
-    def _process_function(self, node: ast.FunctionDef, file_path: str, content: str) -> Dict[str, Any]:
-        """Process a function definition node.
-        
+    def _process_function(self, node: ast.FunctionDef, file_path: str, lines: List[str], documents: ParsedChunks):
+        """Process a function definition node and append it to the chunks.
+
         Parameters
         ----------
         node : ast.FunctionDef
             The function definition node from the AST
         file_path : str
             Path to the file containing the function
-        content : str
-            Source code of the file
-            
-        Returns
-        -------
-        Dict[str, Any]
-            Document chunk with metadata about the function
+        lines : List[str]
+            Source code of the file, pre-split into lines
+        documents : ParsedChunks
+            Columnar collection the chunk is appended to
         """
-        # Get the source code
+        # Get the source code; end_lineno already spans the whole definition
         start_line = node.lineno
-        end_line = max(child.end_lineno for child in ast.walk(node) if hasattr(child, 'end_lineno')) \
-                  if hasattr(node, 'end_lineno') else start_line
-        
-        function_source = '\n'.join(content.split('\n')[start_line-1:end_line])
+        end_line = getattr(node, 'end_lineno', None) or start_line
+
+        function_source = '\n'.join(lines[start_line-1:end_line])
         
         # Extract docstring
-        docstring = ast.get_docstring(node) or ""
+        docstring = _docstring(node)
         
         # Extract arguments
         args = []
         for arg in node.args.args:
-            args.append(arg.arg)
-        
-        logger.debug(f"Processed function {node.name} from {file_path} (lines {start_line}-{end_line}) with {len(args)} arguments")
+            args.append(_intern(arg.arg))
         
-        return {
-            "content": function_source,
-            "metadata": {
-                "file_path": file_path,
-                "type": "function",
-                "name": node.name,
-                "docstring": docstring,
-                "arguments": args,
-                "line_range": (start_line, end_line)
-            }
-        }
\ No newline at end of file
+        documents.append(
+            function_source,
+            file_path,
+            "function",
+            name=node.name,
+            docstring=docstring,
+            line_start=start_line,
+            line_end=end_line,
+            arguments=args,
+        )
\ No newline at end of file
@@ -1,7 +1,20 @@
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
 import re
+import numpy as np
 from ..config import Config
 
+# Compiled once at import; _chunk_text splits sentences inside a loop over
+# paragraphs and the lookbehind pattern is non-trivial to recompile
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Logical chunk boundaries in code: decorators and def/class headers at the
+# start of a line; one C-level scan finds them all
+_BOUNDARY_RE = re.compile(r'^(?:@|[ \t]*def |[ \t]*class )', re.MULTILINE)
+
+# Paragraph separators: blank-line runs, collapsed in one scan so runs of
+# blank lines produce a single break instead of empty paragraphs
+_PARA_SEP_RE = re.compile(r'\n\n+')
+
 
 class Chunker:
     """Split documents into chunks for embedding.
@@ -22,26 +35,51 @@ class Chunker:
         """
         self.chunk_size = chunk_size or Config.CHUNK_SIZE
         self.chunk_overlap = chunk_overlap or Config.CHUNK_OVERLAP
-    
-    def chunk_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+        # Optional langchain backend: its splitters are heavily optimized
+        # and language-aware, but the dependency stays opt-in
+        self._lc_code_splitter = None
+        self._lc_text_splitter = None
+        if Config.CHUNKER_BACKEND == "langchain":
+            try:
+                from langchain_text_splitters import (
+                    Language,
+                    RecursiveCharacterTextSplitter,
+                )
+                self._lc_code_splitter = RecursiveCharacterTextSplitter.from_language(
+                    Language.PYTHON,
+                    chunk_size=self.chunk_size,
+                    chunk_overlap=self.chunk_overlap,
+                )
+                self._lc_text_splitter = RecursiveCharacterTextSplitter(
+                    chunk_size=self.chunk_size,
+                    chunk_overlap=self.chunk_overlap,
+                )
+            except ImportError as e:
+                print(f"langchain-text-splitters not installed, using builtin chunking: {e}")
+
+
+    def chunk_documents(self, documents: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
         """Split documents into chunks, preserving metadata.
-        
+
+        Chunked documents are yielded one at a time, so no full intermediate
+        list is held; callers that need random access materialize with
+        ``list(...)``.
+
         Parameters
         ----------
         documents : List[Dict[str, Any]]
-            List of documents to be chunked, each with content and metadata
-            
-        Returns
-        -------
-        List[Dict[str, Any]]
-            List of chunked documents with updated metadata
+            Documents to be chunked, each with content and metadata
+
+        Yields
+        ------
+        Dict[str, Any]
+            Chunked documents with updated metadata
         """
-        chunked_documents = []
-        
         for doc in documents:
             content = doc["content"]
             metadata = doc["metadata"]
-            
+
             # Special handling based on content type
             if metadata["type"] in ["class", "function"]:
                 # For code, we try to keep "logical blocks" together
@@ -49,18 +87,15 @@ class Chunker:
             else:
                 # For other content, use standard text chunking
                 chunks = self._chunk_text(content)
-            
+
+            total_chunks = len(chunks)
             for i, chunk in enumerate(chunks):
-                chunk_metadata = metadata.copy()
-                chunk_metadata["chunk_index"] = i
-                chunk_metadata["total_chunks"] = len(chunks)
-                
-                chunked_documents.append({
+                # Dict spreading builds the overlay in one C-level operation
+                # instead of a copy plus two item assignments
+                yield {
                     "content": chunk,
-                    "metadata": chunk_metadata
-                })
-        
-        return chunked_documents
+                    "metadata": {**metadata, "chunk_index": i, "total_chunks": total_chunks}
+                }
     
     def _chunk_code(self, content: str, metadata: Dict[str, Any]) -> List[str]:
         """Chunk code by logical structure (simplified approach)
@@ -80,7 +115,11 @@ class Chunker:
         # If it's already small enough, return as is
         if len(content) <= self.chunk_size:
             return [content]
-        
+
+        if self._lc_code_splitter is not None:
+            # Python-aware recursive splitter from langchain
+            return self._lc_code_splitter.split_text(content)
+
         # Identify code type from metadata
         content_type = metadata.get("type", "")
         
@@ -90,46 +129,35 @@ class Chunker:
             if len(content) <= self.chunk_size * 2:  # Allow larger chunks for functions
                 return [content]
         
-        # For classes or larger functions, split by "logical blocs"
-        lines = content.split('\n')
+        # For classes or larger functions, split by "logical blocs".
+        # One multiline regex scan locates every decorator and def/class
+        # header in C; chunks then accumulate whole segments greedily until
+        # the size limit and are emitted as slices of the original content.
+        content_length = len(content)
+        boundaries = [m.start() for m in _BOUNDARY_RE.finditer(content)]
+        if not boundaries or boundaries[0] != 0:
+            boundaries.insert(0, 0)
+        boundaries.append(content_length)
+
         chunks = []
-        current_chunk = []
-        current_size = 0
-        indent_level = None
-        
-        for line in lines:
-            line_with_newline = line + '\n'
-            line_size = len(line_with_newline)
-            
-            # Check for logical boundaries based on indentation
-            stripped = line.lstrip()
-            if stripped and indent_level is None:
-                # Initialize indent level with first non-empty line
-                indent_level = len(line) - len(stripped)
-            
-            # Start new chunk at logical boundaries (methods, decorators, etc.)
-            if (line.startswith('@') or  # Decorator
-                (stripped.startswith('def ') and not line.startswith(' ' * (indent_level + 4) if indent_level is not None else False)) or  # Method/function
-                (stripped.startswith('class ') and not line.startswith(' ' * (indent_level + 4) if indent_level is not None else False))):  # Nested class
-                
-                # If we have an existing chunk that's not empty, save it
-                if current_chunk:
-                    chunks.append('\n'.join(current_chunk))
-                    current_chunk = []
-                    current_size = 0
-            
-            # If this line would make the chunk too large, start a new one
-            if current_size + line_size > self.chunk_size * 1.5 and current_chunk:  # Allow some flexibility
-                chunks.append('\n'.join(current_chunk))
-                current_chunk = []
-                current_size = 0
-            
-            current_chunk.append(line)
-            current_size += line_size
-        
-        # Add the final chunk
-        if current_chunk:
-            chunks.append('\n'.join(current_chunk))
+        size_limit = self.chunk_size * 3 // 2  # Allow some flexibility
+        start = 0
+
+        for i in range(1, len(boundaries)):
+            end = boundaries[i]
+            if end - start > size_limit:
+                previous = boundaries[i - 1]
+                if previous > start:
+                    # Cut at the last boundary that kept the chunk in budget
+                    chunks.append(content[start:previous].rstrip('\n'))
+                    start = previous
+                if end - start > size_limit:
+                    # A single segment exceeds the limit; split it by size
+                    chunks.extend(self._simple_chunk_by_size(content[start:end].rstrip('\n')))
+                    start = end
+
+        if start < content_length:
+            chunks.append(content[start:].rstrip('\n'))
         
         # If we didn't split successfully, fall back to simple size-based chunking
         if not chunks:
@@ -177,56 +205,88 @@ class Chunker:
         # If it's already small enough, return as iss
         if len(text) <= self.chunk_size:
             return [text]
-        
-        # Split by paragraphs first
-        paragraphs = text.split('\n\n')
+
+        if self._lc_text_splitter is not None:
+            return self._lc_text_splitter.split_text(text)
+
+        # Locate paragraph spans with one separator scan instead of
+        # materializing every paragraph up front; paragraph text is only
+        # sliced out when a chunk is emitted. Sizes go into a cumulative
+        # offset array so each cut point is one C-level searchsorted.
+        starts = [0]
+        ends = []
+        for m in _PARA_SEP_RE.finditer(text):
+            ends.append(m.start())
+            starts.append(m.end())
+        ends.append(len(text))
+
+        num_paragraphs = len(starts)
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        sizes = ends - starts + 2
+        offsets = np.concatenate(([0], np.cumsum(sizes)))
+
+        chunks = []
+        i = 0
+        while i < num_paragraphs:
+            # If a single paragraph is too large, split it by sentences
+            if sizes[i] > self.chunk_size:
+                chunks.append(text[starts[i]:ends[i]])
+                chunks[-1:] = self._chunk_paragraph(chunks[-1])
+                i += 1
+                continue
+
+            # Longest run of paragraphs still fitting in one chunk, emitted
+            # as a single slice spanning the original separators
+            j = int(np.searchsorted(offsets, offsets[i] + self.chunk_size, side='right')) - 1
+            j = max(j, i + 1)
+            chunks.append(text[starts[i]:ends[j - 1]])
+            i = j
+
+        return chunks
+
+    def _chunk_paragraph(self, para: str) -> List[str]:
+        """Split a single oversized paragraph by sentences.
+
+        Parameters
+        ----------
+        para : str
+            Paragraph larger than the chunk size
+
+        Returns
+        -------
+        List[str]
+            Sentence-grouped chunks covering the paragraph
+        """
         chunks = []
         current_chunk = []
         current_size = 0
-        
-        for para in paragraphs:
-            para_size = len(para) + 2  # +2 for the newlines
-            
-            # If adding this paragraph would exceed chunk size, save current chunk and start new one
-            if current_size + para_size > self.chunk_size and current_chunk:
+
+        for sentence in _SENTENCE_RE.split(para):
+            sentence_size = len(sentence) + 1  # +1 for the space
+
+            if current_size + sentence_size > self.chunk_size and current_chunk:
                 chunks.append('\n\n'.join(current_chunk))
                 current_chunk = []
                 current_size = 0
-            
-            # If a single paragraph is too large, split it
-            if para_size > self.chunk_size:
-                # Split by sentences
-                sentences = re.split(r'(?<=[.!?])\s+', para)
-                
-                for sentence in sentences:
-                    sentence_size = len(sentence) + 1  # +1 for the space
-                    
-                    if current_size + sentence_size > self.chunk_size and current_chunk:
-                        chunks.append('\n\n'.join(current_chunk))
-                        current_chunk = []
-                        current_size = 0
-                    
-                    # If a single sentence is still too large, use the simple approach
-                    if sentence_size > self.chunk_size:
-                        if current_chunk:
-                            chunks.append('\n\n'.join(current_chunk))
-                        
-                        # Add sentence chunks directly to our chunks list
-                        sentence_chunks = self._simple_chunk_by_size(sentence)
-                        chunks.extend(sentence_chunks)
-                        
-                        current_chunk = []
-                        current_size = 0
-                        continue
-                    
-                    current_chunk.append(sentence)
-                    current_size += sentence_size
-            else:
-                current_chunk.append(para)
-                current_size += para_size
-        
+
+            # If a single sentence is still too large, use the simple approach
+            if sentence_size > self.chunk_size:
+                if current_chunk:
+                    chunks.append('\n\n'.join(current_chunk))
+
+                # Add sentence chunks directly to our chunks list
+                chunks.extend(self._simple_chunk_by_size(sentence))
+
+                current_chunk = []
+                current_size = 0
+                continue
+
+            current_chunk.append(sentence)
+            current_size += sentence_size
+
         # Add the final chunk
         if current_chunk:
             chunks.append('\n\n'.join(current_chunk))
-        
+
         return chunks
@@ -1,5 +1,84 @@
 import ast
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List
+from ..config import Config
+
+# Minimum number of cache misses before extraction is farmed out to worker
+# processes; below this the process-spawn overhead outweighs the parallelism
+_PARALLEL_THRESHOLD = 200
+
+# Documents per task submitted to the pool
+_BATCH_SIZE = 50
+
+
+def _extract_batch(contents: List[str]) -> List[Dict[str, Any]]:
+    """Extract metadata for a batch of contents in a worker process.
+
+    Module-level so it is picklable by ProcessPoolExecutor.
+
+    Parameters
+    ----------
+    contents : List[str]
+        Code contents to analyze
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Extracted metadata dicts, one per content
+    """
+    extractor = MetadataExtractor()
+    return [extractor._extract_code_metadata(content, {}) for content in contents]
+
+
+class _FastExtractor(ast.NodeVisitor):
+    """Collect imports, function calls and branch counts in one traversal.
+
+    Unlike ``ast.walk``, the visitor prunes subtrees that never contribute
+    metadata: argument lists (annotations and default values) are skipped
+    entirely, so large signatures cost nothing to traverse.
+    """
+
+    def __init__(self):
+        self.imports = []
+        self.function_calls = []
+        self.branches = 0
+
+    def visit_Import(self, node):
+        for name in node.names:
+            self.imports.append(name.name)
+
+    def visit_ImportFrom(self, node):
+        module = node.module or ""
+        for name in node.names:
+            self.imports.append(f"{module}.{name.name}")
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Name):
+            self.function_calls.append(func.id)
+        self.generic_visit(node)
+
+    def visit_If(self, node):
+        self.branches += 1
+        self.generic_visit(node)
+
+    def visit_For(self, node):
+        self.branches += 1
+        self.generic_visit(node)
+
+    def visit_While(self, node):
+        self.branches += 1
+        self.generic_visit(node)
+
+    def visit_Try(self, node):
+        self.branches += 1
+        self.generic_visit(node)
+
+    def visit_arguments(self, node):
+        # Annotations and defaults carry no imports and are not counted
+        pass
 
 
 class MetadataExtractor:
@@ -7,34 +86,103 @@ class MetadataExtractor:
     
     This class provides functionality to analyze code content and extract
     meaningful metadata such as imports, function calls, and complexity metrics.
+    Extracted metadata is cached on disk per (file path, mtime, line range),
+    so re-indexing an unchanged file skips the AST parse entirely.
     """
-    
+
+    def __init__(self):
+        self._cache_path = os.path.join(
+            os.path.expanduser("~"), ".codepilot", Config.METADATA_CACHE_PATH
+        )
+        # Loaded lazily on the first enrich_metadata call
+        self._cache = None
+        self._cache_dirty = False
+
+    def _load_cache(self) -> Dict[tuple, Dict[str, Any]]:
+        """Load the persistent metadata cache, or start empty.
+
+        Returns
+        -------
+        Dict[tuple, Dict[str, Any]]
+            Cached metadata keyed by (file_path, mtime, line_range)
+        """
+        if self._cache is None:
+            try:
+                with open(self._cache_path, 'rb') as f:
+                    self._cache = pickle.load(f)
+            except (OSError, pickle.PickleError, EOFError):
+                self._cache = {}
+        return self._cache
+
+    def _save_cache(self):
+        """Persist the metadata cache if it gained new entries."""
+        if not self._cache_dirty:
+            return
+        os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+        with open(self._cache_path, 'wb') as f:
+            pickle.dump(self._cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._cache_dirty = False
+
     def enrich_metadata(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add additional metadata to documents based on content analysis.
-        
+
         Parameters
         ----------
         documents : List[Dict[str, Any]]
             List of document dictionaries containing content and metadata
-            
+
         Returns
         -------
         List[Dict[str, Any]]
             Documents with enriched metadata
         """
         enriched_documents = []
-        
+        cache = self._load_cache()
+        pending = []  # (doc, cache key) pairs that need extraction
+
         for doc in documents:
-            content = doc["content"]
             metadata = doc["metadata"]
-            
+
             if metadata["type"] in ["class", "function"]:
-                # Extract additional metadata for code
-                enriched_metadata = self._extract_code_metadata(content, metadata)
-                doc["metadata"].update(enriched_metadata)
-            
+                # Unchanged files hit the cache and skip the AST parse
+                key = None
+                file_path = metadata.get("file_path")
+                if file_path:
+                    try:
+                        key = (file_path, os.path.getmtime(file_path), metadata.get("line_range"))
+                    except OSError:
+                        key = None
+
+                if key is not None and key in cache:
+                    doc["metadata"].update(cache[key])
+                else:
+                    pending.append((doc, key))
+
             enriched_documents.append(doc)
-        
+
+        if pending:
+            # Extraction is independent per document, so large miss sets are
+            # spread across processes; the cache stays single-writer here
+            if len(pending) >= _PARALLEL_THRESHOLD:
+                contents = [doc["content"] for doc, _ in pending]
+                batches = [contents[i:i + _BATCH_SIZE] for i in range(0, len(contents), _BATCH_SIZE)]
+                results = []
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    for batch_result in executor.map(_extract_batch, batches):
+                        results.extend(batch_result)
+            else:
+                results = [
+                    self._extract_code_metadata(doc["content"], doc["metadata"])
+                    for doc, _ in pending
+                ]
+
+            for (doc, key), enriched_metadata in zip(pending, results):
+                doc["metadata"].update(enriched_metadata)
+                if key is not None:
+                    cache[key] = enriched_metadata
+                    self._cache_dirty = True
+
+        self._save_cache()
         return enriched_documents
     
     def _extract_code_metadata(self, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -56,40 +204,21 @@ class MetadataExtractor:
         
         try:
             tree = ast.parse(content)
-            
-            # Extract imports
-            imports = []
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for name in node.names:
-                        imports.append(name.name)
-                elif isinstance(node, ast.ImportFrom):
-                    module = node.module or ""
-                    for name in node.names:
-                        imports.append(f"{module}.{name.name}")
-            
-            if imports:
-                additional_metadata["imports"] = imports
-            
-            # Extract function calls
-            function_calls = []
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call) and hasattr(node.func, 'id'):
-                    function_calls.append(node.func.id)
-            
-            if function_calls:
-                additional_metadata["function_calls"] = function_calls
-            
-            # Complexity analysis - count branches
-            branches = 0
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.If, ast.For, ast.While, ast.Try)):
-                    branches += 1
-            
+
+            # One pruned traversal collects all three metadata kinds
+            extractor = _FastExtractor()
+            extractor.visit(tree)
+
+            if extractor.imports:
+                additional_metadata["imports"] = extractor.imports
+
+            if extractor.function_calls:
+                additional_metadata["function_calls"] = extractor.function_calls
+
             additional_metadata["complexity"] = {
-                "branches": branches
+                "branches": extractor.branches
             }
-            
+
         except SyntaxError:
             # If parsing fails, we skip the additional metadata
             pass
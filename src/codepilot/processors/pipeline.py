@@ -0,0 +1,48 @@
+from typing import Dict, Any, Iterator, List
+from .chunker import Chunker
+from .metadata_extractor import MetadataExtractor
+
+
+class Pipeline:
+    """Fused metadata-extraction and chunking stage.
+
+    Indexing used to run two full passes over the parsed documents: one
+    through `MetadataExtractor` and a second through `Chunker`. The
+    pipeline keeps enrichment as the first step (so its on-disk cache and
+    process-pool batching still apply) and streams the enriched documents
+    straight through the chunker's generator, so no intermediate chunk
+    list is built.
+    """
+
+    def __init__(self, chunker: Chunker = None, metadata_extractor: MetadataExtractor = None):
+        """Initialize the pipeline with its processing components.
+
+        Parameters
+        ----------
+        chunker : Chunker, optional
+            Chunker to split documents with; a default one is created if omitted
+        metadata_extractor : MetadataExtractor, optional
+            Extractor for enriching metadata; a default one is created if omitted
+        """
+        self.chunker = chunker or Chunker()
+        self.metadata_extractor = metadata_extractor or MetadataExtractor()
+
+    def process(self, documents: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Enrich and chunk parsed documents in a single streaming pass.
+
+        Chunked documents are yielded as they are produced; only the
+        consumer decides whether to materialize them.
+
+        Parameters
+        ----------
+        documents : List[Dict[str, Any]]
+            Parsed documents with content and metadata
+
+        Yields
+        ------
+        Dict[str, Any]
+            Chunked documents with enriched metadata, ready for embedding
+        """
+        yield from self.chunker.chunk_documents(
+            self.metadata_extractor.enrich_metadata(documents)
+        )
@@ -1,3 +1,5 @@
+import hashlib
+import os
 import numpy as np
 from typing import List, Dict, Any
 import torch
@@ -5,6 +7,25 @@ from transformers import AutoTokenizer, AutoModel
 from ..config import Config
 
 
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize embeddings in place so inner product equals cosine.
+
+    Parameters
+    ----------
+    embeddings : np.ndarray
+        Matrix of embeddings with shape (n, dimension)
+
+    Returns
+    -------
+    np.ndarray
+        The same array, with unit-norm rows
+    """
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    embeddings /= norms
+    return embeddings
+
+
 class EmbeddingGenerator:
     """Generate embeddings for documents using a Hugging Face code embedding model.
     
@@ -21,71 +42,258 @@ class EmbeddingGenerator:
             Name of the Hugging Face model to use for embeddings
         """
         self.model_name = model_name or Config.EMBEDDING_MODEL
-        # Load model and tokenizer
-        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        self.provider = getattr(Config, "EMBEDDING_PROVIDER", "huggingface")
+
+        # Disk cache keyed by content hash, namespaced per embedding
+        # configuration: rows computed under a different model, provider,
+        # pooling or metric live in a different subdirectory, so a config
+        # change becomes a clean miss instead of silently serving vectors
+        # from the old embedding space
+        config_key = hashlib.blake2b(
+            "|".join((
+                self.model_name,
+                self.provider,
+                Config.EMBEDDING_BACKEND,
+                Config.POOLING,
+                Config.METRIC,
+            )).encode(),
+            digest_size=8,
+        ).hexdigest()
+        self._cache_dir = os.path.join(
+            os.path.expanduser("~"), ".codepilot", Config.EMBEDDING_CACHE_DIR, config_key
+        )
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+        if self.provider == "ollama":
+            # Delegate embedding to the Ollama server; no local model needed
+            from ..llm.ollama_client import OllamaClient
+            self._ollama_client = OllamaClient()
+            return
+
+        # Use all physical cores for CPU inference; PyTorch's default thread
+        # count is often misdetected and cripples BERT-style models
+        num_threads = Config.NUM_THREADS or int(os.environ.get("CODEPILOT_NUM_THREADS", os.cpu_count() or 1))
+        try:
+            torch.set_num_threads(num_threads)
+            torch.set_num_interop_threads(max(1, num_threads // 2))
+        except RuntimeError:
+            # Interop thread count can only be set before parallel work starts
+            pass
+
+        # Load model and tokenizer; the fast (Rust) tokenizer batches
+        # internally in parallel and emits contiguous tensors directly
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+
+        if Config.EMBEDDING_BACKEND == "onnx":
+            # ONNX Runtime runs a graph-optimized export with fused ops,
+            # typically several times faster than eager PyTorch on CPU; the
+            # ORT model mirrors the transformers output interface
+            try:
+                from optimum.onnxruntime import ORTModelForFeatureExtraction
+                self.model = ORTModelForFeatureExtraction.from_pretrained(self.model_name, export=True)
+                self.device = "cpu"
+                self.use_fp16 = False
+                self.use_bf16 = False
+                return
+            except ImportError as e:
+                print(f"optimum[onnxruntime] not installed, falling back to torch: {e}")
+
         self.model = AutoModel.from_pretrained(self.model_name)
-        # Force CPU usage
-        self.device = "cpu"
+        # Use the GPU when available, otherwise fall back to CPU
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.use_fp16 = Config.USE_FP16 and self.device == "cuda"
+        if self.use_fp16:
+            # Halve memory traffic and use tensor cores on the GPU; outputs
+            # are cast back to FP32 before they reach FAISS
+            self.model = self.model.half()
+        # bfloat16 autocast halves memory bandwidth on CPUs with native
+        # bf16 support; ops without bf16 kernels fall back to fp32
+        self.use_bf16 = Config.USE_BF16 and self.device == "cpu"
         self.model.to(self.device)
+        self.model.eval()
+
+        if Config.EMBEDDING_BACKEND == "ipex" and self.device == "cpu":
+            # Intel Extension for PyTorch rewrites the graph with fused,
+            # AVX-512/AMX-tuned kernels; combined with the bf16 autocast
+            # above this is the fastest eager CPU path on Xeon hardware
+            try:
+                import intel_extension_for_pytorch as ipex
+                dtype = torch.bfloat16 if self.use_bf16 else None
+                self.model = ipex.optimize(self.model, dtype=dtype, level="O1")
+            except ImportError as e:
+                print(f"intel-extension-for-pytorch not installed, using plain torch: {e}")
+
+        if Config.EMBEDDING_BACKEND == "compile":
+            # Trade one-off compilation time for fused kernels on every
+            # subsequent forward pass; dynamic=True keeps one graph across
+            # the varying padded batch shapes instead of recompiling per shape
+            try:
+                self.model = torch.compile(self.model, mode="reduce-overhead", dynamic=True, fullgraph=False)
+                # Warm up once so compilation cost is paid here, not inside
+                # the first real batch
+                warmup = self.tokenizer(["pass"], return_tensors='pt')
+                warmup = {k: v.to(self.device) for k, v in warmup.items()}
+                with torch.inference_mode():
+                    self.model(**warmup)
+            except Exception as e:
+                print(f"torch.compile unavailable, falling back to eager mode: {e}")
     
     def generate_embeddings(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings for a list of texts.
-        
+
+        Texts whose content hash is already in the disk cache are loaded
+        from it; only the remainder goes through the model, and new rows
+        are written back for the next run.
+
         Parameters
         ----------
         texts : List[str]
             List of text strings to generate embeddings for
-            
+
         Returns
         -------
         np.ndarray
             Array of embedding vectors, one for each input text
         """
-        embeddings = []
-        
-        # Process in small batches
-        batch_size = 8
-        for i in range(0, len(texts), batch_size):
-            if i > 0 and i % (batch_size * 5) == 0:
-                print(f"Generated embeddings for {i}/{len(texts)} texts")
-            
-            batch_texts = texts[i:i+batch_size]
-            batch_embeddings = self._get_embeddings_batch(batch_texts)
-            embeddings.extend(batch_embeddings)
-        
-        return np.array(embeddings, dtype=np.float32)
+        embeddings = np.empty((len(texts), Config.VECTOR_DIMENSION), dtype=np.float32)
+
+        # blake2b is the fastest stdlib hash for this; the digest just has
+        # to be collision-resistant over chunk contents
+        cache_paths = []
+        misses = []
+        for i, text in enumerate(texts):
+            digest = hashlib.blake2b(text.encode(), digest_size=32).hexdigest()
+            cache_path = os.path.join(self._cache_dir, f"{digest}.npy")
+            cache_paths.append(cache_path)
+            try:
+                embeddings[i] = np.load(cache_path)
+            except (OSError, ValueError):
+                misses.append(i)
+
+        if misses:
+            # Duplicate chunks within a run (identical small functions,
+            # repeated docstrings) are embedded once; the finished row is
+            # fanned out to every occurrence afterwards
+            unique_texts = []
+            unique_rows = {}
+            idx_map = []
+            for i in misses:
+                row = unique_rows.setdefault(cache_paths[i], len(unique_texts))
+                if row == len(unique_texts):
+                    unique_texts.append(texts[i])
+                idx_map.append(row)
+
+            miss_embeddings = self._embed_uncached(unique_texts)
+            for pos, i in enumerate(misses):
+                embeddings[i] = miss_embeddings[idx_map[pos]]
+            # Every failure fallback (model errors, unreachable Ollama)
+            # produces an all-zero row; persisting one would serve the
+            # failure forever, so only rows from successful forward passes
+            # are written to the cache
+            for path, row in unique_rows.items():
+                if not miss_embeddings[row].any():
+                    continue
+                try:
+                    np.save(path, miss_embeddings[row])
+                except OSError:
+                    pass
+
+        return embeddings
+
+    def _embed_uncached(self, texts: List[str]) -> np.ndarray:
+        """Run the embedding model over texts not served by the cache.
+
+        Parameters
+        ----------
+        texts : List[str]
+            Text strings to embed
+
+        Returns
+        -------
+        np.ndarray
+            Finished (normalized, fp32) embedding rows
+        """
+        if self.provider == "ollama":
+            # Batch the requests concurrently against the Ollama server
+            import asyncio
+            embeddings = asyncio.run(self._ollama_client.aget_embeddings(texts))
+            embeddings = np.array(embeddings, dtype=np.float32)
+            if Config.METRIC == "ip":
+                _normalize(embeddings)
+            return embeddings
+
+        # Preallocate the output matrix and fill it batch by batch instead of
+        # accumulating a list and copying it into an array at the end
+        embeddings = np.empty((len(texts), Config.VECTOR_DIMENSION), dtype=np.float32)
+
+        # Tokenize once (no padding) to learn each text's token length, then
+        # batch texts of adjacent lengths together; each batch is padded only
+        # to its own longest member instead of the corpus maximum
+        token_ids = self.tokenizer(texts, truncation=True, max_length=512)["input_ids"]
+        order = sorted(range(len(texts)), key=lambda i: len(token_ids[i]))
+
+        batch_size = Config.EMBED_BATCH_SIZE
+        for start in range(0, len(order), batch_size):
+            if start > 0 and start % (batch_size * 5) == 0:
+                print(f"Generated embeddings for {start}/{len(texts)} texts")
+
+            batch = order[start:start+batch_size]
+            # Fancy indexing writes each row back to its original position
+            embeddings[batch] = self._get_embeddings_batch([texts[i] for i in batch])
+
+        if Config.METRIC == "ip":
+            _normalize(embeddings)
+        return embeddings
     
-    def _get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+    def _get_embeddings_batch(self, texts: List[str]) -> np.ndarray:
         """Get embeddings for a batch of texts using the HuggingFace model.
-        
+
         Parameters
         ----------
         texts : List[str]
             Batch of text strings to process together
-            
+
         Returns
         -------
-        List[List[float]]
-            List of embedding vectors as lists of floats
+        np.ndarray
+            Embedding matrix with one float32 row per text
         """
         try:
             # Tokenize inputs
             encoded_input = self.tokenizer(
-                texts, 
-                padding=True, 
-                truncation=True, 
-                max_length=512, 
+                texts,
+                padding='longest',
+                truncation=True,
+                max_length=512,
                 return_tensors='pt'
             )
             
+            encoded_input = {k: v.to(self.device) for k, v in encoded_input.items()}
+
             # Get model output
-            with torch.no_grad():
-                outputs = self.model(**encoded_input)
-                # Use CLS token embedding (first token) for sentence representation
-                embeddings = outputs.last_hidden_state[:, 0, :].cpu().numpy()
-            
-            return embeddings.tolist()
+            with torch.inference_mode():
+                if self.use_fp16:
+                    with torch.autocast("cuda", dtype=torch.float16):
+                        outputs = self.model(**encoded_input)
+                elif self.use_bf16:
+                    with torch.autocast("cpu", dtype=torch.bfloat16):
+                        outputs = self.model(**encoded_input)
+                else:
+                    outputs = self.model(**encoded_input)
+
+                if Config.POOLING == "mean":
+                    # Average the token embeddings, masking out the padding
+                    hidden = outputs.last_hidden_state
+                    mask = encoded_input['attention_mask'].unsqueeze(-1).to(hidden.dtype)
+                    pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+                else:
+                    # Use CLS token embedding (first token) for sentence representation
+                    pooled = outputs.last_hidden_state[:, 0, :]
+                # Returned as a float32 matrix; the caller writes the rows
+                # straight into its preallocated output, no Python floats
+                return pooled.float().cpu().numpy()
         except Exception as e:
             print(f"Error generating embeddings: {e}")
             # Return zero vectors as fallback
-            return [[0.0] * Config.VECTOR_DIMENSION] * len(texts)
\ No newline at end of file
+            return np.zeros((len(texts), Config.VECTOR_DIMENSION), dtype=np.float32)
\ No newline at end of file
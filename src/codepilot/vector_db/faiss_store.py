@@ -1,12 +1,78 @@
+import atexit
 import faiss
 import numpy as np
 import json
 import os
+import pickle
 from typing import List, Dict, Any, Tuple, Optional
 from ..config import Config
 from ..logging.logger import get_logger
 
 
+# Buffered add batches are flushed to FAISS once this many rows accumulate
+_PENDING_FLUSH_ROWS = 4096
+
+
+class _MissingType:
+    """Sentinel marking fields a row never carried (distinct from None)."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __reduce__(self):
+        # Keep sentinel identity across pickle round trips
+        return (_MissingType, ())
+
+
+_MISSING = _MissingType()
+
+
+class _MetadataColumns:
+    """Column-major storage for document metadata.
+
+    One list per field instead of one dict per document: the per-dict
+    hash-table overhead disappears, shared keys are stored once, and
+    pickling serializes a handful of flat lists instead of N dicts.
+    Rows are rebuilt as plain dicts on access, so `search()` results
+    look exactly as before.
+    """
+
+    def __init__(self):
+        self._columns = {}
+        self._length = 0
+
+    def append(self, metadata: Dict[str, Any]) -> None:
+        """Append one metadata row.
+
+        Parameters
+        ----------
+        metadata : Dict[str, Any]
+            Metadata dictionary for a single document
+        """
+        for key, column in self._columns.items():
+            column.append(metadata.get(key, _MISSING))
+        for key in metadata:
+            if key not in self._columns:
+                # First time this field appears; backfill earlier rows
+                self._columns[key] = [_MISSING] * self._length + [metadata[key]]
+        self._length += 1
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        row = {}
+        for key, column in self._columns.items():
+            value = column[index]
+            if value is not _MISSING:
+                row[key] = value
+        return row
+
+
 class FaissVectorStore:
     """Vector store implementation using FAISS.
     
@@ -14,26 +80,70 @@ class FaissVectorStore:
     for efficient similarity search and clustering of dense vectors.
     """
     
-    def __init__(self, dimension=768):
+    def __init__(self, dimension=768, use_gpu: bool = None):
         """Initialize a FAISS vector store.
-        
+
         Parameters
         ----------
         dimension : int, optional
             Dimensionality of the embedding vectors, defaults to 768
+        use_gpu : bool, optional
+            Run the index on GPU 0; defaults to `Config.USE_GPU`
         """
         self.logger = get_logger(__name__)
         self.index = None
-        self.metadata = []
+        self.metadata = _MetadataColumns()
         self.dimension = dimension
-        
+        # Stable document ids: FAISS returns them from search regardless of
+        # how the underlying index reorders storage, and remove() can drop
+        # entries without rebuilding. Metadata rows are append-only; the map
+        # links each live id to its row.
+        self.next_id = 0
+        self._id_to_row = {}
+        self._base_index = None
+        # Set by load(); the file is only unpickled when first touched
+        self._pending_metadata_path = None
+        # Small add batches accumulate here until _flush_pending()
+        self._pending_embeddings = []
+        self._pending_ids = []
+        self._pending_rows = 0
+        # (row count, live-id count) at the last metadata write; save()
+        # skips the metadata rewrite when neither has changed
+        self._metadata_saved_state = None
+
+        # FAISS parallelizes search with OpenMP but inherits whatever thread
+        # count the environment happened to set; pin it explicitly so batched
+        # searches are not accidentally single-threaded. PASSIVE keeps idle
+        # worker threads from spinning between queries in interactive use.
+        os.environ.setdefault("OMP_WAIT_POLICY", "PASSIVE")
+        num_threads = Config.FAISS_THREADS or os.cpu_count() or 1
+        try:
+            faiss.omp_set_num_threads(num_threads)
+            self.logger.info(f"FAISS using {num_threads} OpenMP threads")
+        except AttributeError:
+            pass
+        self.use_gpu = Config.USE_GPU if use_gpu is None else use_gpu
+        # GPU workspace is allocated once and reused across searches
+        self._gpu_resources = None
+
+        # Deferred persistence: adds mark the store dirty and saving happens
+        # every SAVE_EVERY batches, on flush(), or at interpreter exit
+        self.save_every = Config.SAVE_EVERY
+        self._dirty = False
+        self._adds_since_save = 0
+        atexit.register(self.flush)
+
         data_dir = os.path.join(os.path.expanduser("~"), ".codepilot", "data")
         self.index_path = os.path.join(data_dir, Config.INDEX_PATH)
         self.metadata_path = os.path.join(data_dir, Config.METADATA_PATH)
-        
+        # Metadata written by versions that stored JSON; migrated on load
+        self._legacy_metadata_path = os.path.join(data_dir, "metadata.json")
+
         os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
-        
-        if os.path.exists(self.index_path) and os.path.exists(self.metadata_path):
+
+        if os.path.exists(self.index_path) and (
+            os.path.exists(self.metadata_path) or os.path.exists(self._legacy_metadata_path)
+        ):
             try:
                 self.load()
                 self.logger.info(f"Successfully loaded existing index from {self.index_path}")
@@ -44,19 +154,138 @@ class FaissVectorStore:
             self._create_empty_index()
             self.logger.info(f"No existing index found at {self.index_path}. Created a new empty index.")
     
+    def _build_index(self, nlist: Optional[int] = None):
+        """Build a FAISS index according to `Config.INDEX_TYPE`.
+
+        Parameters
+        ----------
+        nlist : int, optional
+            Override for the number of IVF partitions; defaults to
+            `Config.IVF_NLIST`
+
+        Returns
+        -------
+        faiss.Index
+            The newly constructed (untrained) FAISS index
+        """
+        index_type = getattr(Config, "INDEX_TYPE", "flat").lower()
+        # Embeddings are L2-normalized by the generator, so inner product is
+        # cosine similarity and skips the squared-norm terms of L2
+        metric = faiss.METRIC_INNER_PRODUCT if Config.METRIC == "ip" else faiss.METRIC_L2
+
+        if index_type == "hnsw":
+            # HNSW graph search visits O(log N) vectors per query instead of
+            # scanning all of them; no training step and no remove support,
+            # which fits the append-only metadata list
+            index = faiss.IndexHNSWFlat(self.dimension, Config.HNSW_M, metric)
+            index.hnsw.efConstruction = Config.HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = Config.HNSW_EF_SEARCH
+            return index
+
+        if index_type == "ivfpq":
+            # IVF partitioning + product quantization: compressed storage and
+            # sub-linear search at a modest recall cost
+            nlist = nlist or Config.IVF_NLIST
+            quantizer = self._flat_index(metric)
+            index = faiss.IndexIVFPQ(
+                quantizer, self.dimension,
+                nlist, Config.PQ_M, Config.PQ_NBITS, metric
+            )
+            index.nprobe = min(max(1, nlist // 4), Config.IVF_NPROBE)
+            return index
+
+        if index_type == "ivfpqfs":
+            # PQ fast-scan: 4-bit sub-codes packed for SIMD-shuffle distance
+            # lookups, several times faster than the classic IVFPQ kernel
+            nlist = nlist or Config.IVF_NLIST
+            quantizer = self._flat_index(metric)
+            index = faiss.IndexIVFPQFastScan(
+                quantizer, self.dimension, nlist, Config.PQFS_M, 4, metric
+            )
+            index.nprobe = min(max(1, nlist // 4), Config.IVF_NPROBE)
+            return index
+
+        if index_type == "sq8":
+            # INT8 scalar quantization: 4x smaller vectors with negligible
+            # recall loss; queries stay FP32 and are dequantized on the fly
+            return faiss.IndexScalarQuantizer(
+                self.dimension, faiss.ScalarQuantizer.QT_8bit, metric
+            )
+
+        if index_type == "ivfsq8":
+            # IVF partitioning over INT8-quantized vectors: the 4x bandwidth
+            # saving of sq8 combined with sub-linear partition search
+            nlist = nlist or Config.IVF_NLIST
+            quantizer = self._flat_index(metric)
+            index = faiss.IndexIVFScalarQuantizer(
+                quantizer, self.dimension, nlist,
+                faiss.ScalarQuantizer.QT_8bit, metric
+            )
+            index.nprobe = min(max(1, nlist // 4), Config.IVF_NPROBE)
+            return index
+
+        # Default: exact flat index
+        return self._flat_index(metric)
+
+    def _flat_index(self, metric):
+        """Build a flat index for the given FAISS metric.
+
+        Parameters
+        ----------
+        metric : int
+            A FAISS metric constant (METRIC_L2 or METRIC_INNER_PRODUCT)
+
+        Returns
+        -------
+        faiss.Index
+            A flat index using the requested metric
+        """
+        if metric == faiss.METRIC_INNER_PRODUCT:
+            return faiss.IndexFlatIP(self.dimension)
+        return faiss.IndexFlatL2(self.dimension)
+
     def _create_empty_index(self):
         """Initialize an empty FAISS index with the specified dimension.
-        
-        This method creates a new L2-distance (Euclidean) FAISS index.
+
+        The index type is selected via `Config.INDEX_TYPE`.
         """
-        self.index = faiss.IndexFlatL2(self.dimension)
-        self.logger.info(f"Created new empty FAISS index with dimension {self.dimension}")
+        self._base_index = self._build_index()
+        self.index = faiss.IndexIDMap2(self._base_index)
+        self.logger.info(f"Created new empty FAISS index ({Config.INDEX_TYPE}) with dimension {self.dimension}")
+
+        # Surface which SIMD level this faiss build dispatches to; a generic
+        # (non-AVX2/AVX-512) wheel leaves easy distance-kernel speed on the table
+        try:
+            self.logger.info(f"FAISS compile options: {faiss.get_compile_options()}")
+        except AttributeError:
+            pass
         
         try:
             self.save()
             self.logger.info(f"Saved empty index to {self.index_path}")
         except Exception as e:
             self.logger.error(f"Failed to save empty index: {e}")
+
+        self._maybe_to_gpu()
+
+    def _maybe_to_gpu(self):
+        """Move the index to GPU 0 when GPU use is enabled and available.
+
+        The flat-scan and IVF search kernels parallelize over
+        (query x database) pairs, so GPU offload gives order-of-magnitude
+        speedups on large corpora. Falls back to CPU silently when the
+        installed faiss build has no GPU support.
+        """
+        if not self.use_gpu or self.index is None:
+            return
+        try:
+            if self._gpu_resources is None:
+                self._gpu_resources = faiss.StandardGpuResources()
+            self.index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, self.index)
+            self.logger.info("Moved FAISS index to GPU 0")
+        except (AttributeError, RuntimeError) as e:
+            self.logger.warning(f"FAISS GPU support unavailable, staying on CPU: {e}")
+            self.use_gpu = False
     
     def add_documents(self, documents: List[Dict[str, Any]], embeddings: np.ndarray) -> None:
         """Add documents and their embeddings to the vector store.
@@ -68,25 +297,95 @@ class FaissVectorStore:
         embeddings : np.ndarray
             Matrix of document embeddings with shape (n_documents, dimension)
         """
+        self._ensure_metadata()
+
+        # FAISS only takes C-contiguous float32; anything else triggers a
+        # hidden copy inside the wrapper, so convert once up front
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
         if self.index is None:
             self.dimension = embeddings.shape[1]
             self._create_empty_index()
-        
-        # Store metadata
-        for doc in documents:
+        elif embeddings.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {embeddings.shape[1]} does not match index dimension {self.dimension}"
+            )
+
+
+        # Assign sequential ids and store metadata
+        ids = np.arange(self.next_id, self.next_id + len(documents), dtype=np.int64)
+        self.next_id += len(documents)
+        for doc, doc_id in zip(documents, ids.tolist()):
+            self._id_to_row[doc_id] = len(self.metadata)
             self.metadata.append(doc["metadata"])
-        
-        # Add vectors to the index
-        self.index.add(embeddings)
-        
-        self.logger.info(f"Added {len(documents)} documents to vector store. Total: {self.index.ntotal}")
-        
-        # Save index to disk after adding documents
+
+        # Buffer the batch: FAISS grows its contiguous storage on every add,
+        # so feeding it a few large arrays instead of many small ones avoids
+        # repeated reallocation and copying of the stored vectors
+        self._pending_embeddings.append(embeddings)
+        self._pending_ids.append(ids)
+        self._pending_rows += len(embeddings)
+        if self._pending_rows >= _PENDING_FLUSH_ROWS:
+            self._flush_pending()
+
+        self.logger.info(f"Added {len(documents)} documents to vector store")
+
+        # Rewriting the full index after every batch is O(total) I/O per
+        # call; mark dirty and let the save counter / flush() persist it
+        self._dirty = True
+        self._adds_since_save += 1
+        if self.save_every and self._adds_since_save >= self.save_every:
+            try:
+                self.save()
+                self.logger.info(f"Saved index to {self.index_path} after adding documents")
+            except Exception as e:
+                self.logger.error(f"Failed to save index after adding documents: {e}")
+
+    def _flush_pending(self) -> None:
+        """Add all buffered embeddings to the FAISS index in one batch."""
+        if not self._pending_rows:
+            return
+
+        if len(self._pending_embeddings) == 1:
+            embeddings = self._pending_embeddings[0]
+            ids = self._pending_ids[0]
+        else:
+            embeddings = np.concatenate(self._pending_embeddings, axis=0)
+            ids = np.concatenate(self._pending_ids)
+        self._pending_embeddings = []
+        self._pending_ids = []
+        self._pending_rows = 0
+
+        # Quantizing index types (e.g. IVFPQ) must be trained on a sample of
+        # the embeddings before vectors can be added
+        if not self.index.is_trained:
+            # Size the IVF partition count to the actual corpus (~4*sqrt(N));
+            # the configured nlist assumes a large corpus, and clustering with
+            # fewer than ~39 training points per centroid degrades recall
+            nlist = getattr(self._base_index, "nlist", 0)
+            if nlist and len(embeddings) < 39 * nlist:
+                nlist = max(1, min(nlist, int(4 * len(embeddings) ** 0.5)))
+                self.logger.info(f"Rebuilding IVF index with nlist={nlist} for {len(embeddings)} vectors")
+                self._base_index = self._build_index(nlist=nlist)
+                self.index = faiss.IndexIDMap2(self._base_index)
+            train_sample = embeddings[:min(len(embeddings), 100_000)]
+            self.logger.info(f"Training FAISS index on {len(train_sample)} vectors")
+            self.index.train(train_sample)
+
+        # Add vectors to the index under their stable ids
+        self.index.add_with_ids(embeddings, ids)
+        self.logger.info(f"Flushed {len(ids)} buffered vectors to index. Total: {self.index.ntotal}")
+
+    def flush(self) -> None:
+        """Persist the store to disk if it has unsaved changes."""
+        if self.index is not None:
+            self._flush_pending()
+        if not self._dirty or self.index is None:
+            return
         try:
             self.save()
-            self.logger.info(f"Saved index to {self.index_path} after adding documents")
         except Exception as e:
-            self.logger.error(f"Failed to save index after adding documents: {e}")
+            self.logger.error(f"Failed to flush vector store: {e}")
     
     def search(self, query_embedding: np.ndarray, top_k: int = None) -> List[Dict[str, Any]]:
         """Search for similar documents based on query embedding.
@@ -103,31 +402,88 @@ class FaissVectorStore:
         List[Dict[str, Any]]
             List of search results with metadata and distance scores
         """
+        if len(query_embedding.shape) == 1:
+            query_embedding = query_embedding.reshape(1, -1)
+        return self.search_batch(query_embedding, top_k)[0]
+
+    def search_batch(self, query_embeddings: np.ndarray, top_k: int = None) -> List[List[Dict[str, Any]]]:
+        """Search for similar documents for a batch of query embeddings.
+
+        One FAISS call over the whole batch amortizes the BLAS kernel setup
+        that a loop of single-query searches would pay per query.
+
+        Parameters
+        ----------
+        query_embeddings : np.ndarray
+            Query embedding matrix with shape (n_queries, dimension)
+        top_k : int, optional
+            Number of top results to retrieve per query
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            One result list per query, each with metadata and distance scores
+        """
         if top_k is None:
             top_k = Config.TOP_K
-        
+
+        if self.index is not None:
+            # Buffered adds must be searchable immediately
+            self._flush_pending()
+
         if self.index is None or self.index.ntotal == 0:
-            return []
-        
-        if len(query_embedding.shape) == 1:
-            query_embedding = query_embedding.reshape(1, -1)
-        
+            return [[] for _ in range(len(query_embeddings))]
+
+        self._ensure_metadata()
+        query_embeddings = np.ascontiguousarray(query_embeddings, dtype=np.float32)
+
         # Search index
-        distances, indices = self.index.search(query_embedding, top_k)
-        
-        # Return results with metadata
-        results = []
-        for i, idx in enumerate(indices[0]):
-            if idx < 0 or idx >= len(self.metadata):
-                continue  # Skip invalid indices
-            
-            results.append({
-                "metadata": self.metadata[idx],
-                "distance": float(distances[0][i])
-            })
-        
-        return results
-    
+        distances, indices = self.index.search(query_embeddings, top_k)
+
+        # Return results with metadata. Missing hits (-1) are masked out in
+        # one vectorized pass and distances converted with a single tolist()
+        # instead of per-element float() boxing; ids map to metadata rows
+        # through the stable-id table
+        metadata = self.metadata
+        id_to_row = self._id_to_row
+        batch_results = []
+        for row_ids, row_distances in zip(indices, distances):
+            valid = row_ids >= 0
+            # Removed or unknown ids resolve to None and are dropped; the
+            # comprehension skips the per-hit append and bound-method lookups
+            rows = [id_to_row.get(doc_id) for doc_id in row_ids[valid].tolist()]
+            batch_results.append([
+                {"metadata": metadata[row], "distance": distance}
+                for row, distance in zip(rows, row_distances[valid].tolist())
+                if row is not None
+            ])
+
+        return batch_results
+
+    def remove(self, ids: List[int]) -> int:
+        """Remove documents from the store by their stable ids.
+
+        Parameters
+        ----------
+        ids : List[int]
+            Ids previously assigned by `add_documents`
+
+        Returns
+        -------
+        int
+            Number of vectors actually removed from the index
+        """
+        self._ensure_metadata()
+        self._flush_pending()
+        id_array = np.asarray(ids, dtype=np.int64)
+        removed = self.index.remove_ids(faiss.IDSelectorBatch(id_array))
+        for doc_id in id_array.tolist():
+            self._id_to_row.pop(doc_id, None)
+        self._dirty = True
+        self.logger.info(f"Removed {removed} documents from vector store")
+        return removed
+
+
     def save(self, index_path: Optional[str] = None, metadata_path: Optional[str] = None) -> None:
         """Save the index and metadata to disk.
         
@@ -136,24 +492,47 @@ class FaissVectorStore:
         index_path : str, optional
             Path to save the FAISS index
         metadata_path : str, optional
-            Path to save the metadata JSON file
+            Path to save the metadata pickle file
         """
         index_path = index_path or self.index_path
         metadata_path = metadata_path or self.metadata_path
-        
+
         if self.index is None:
             raise ValueError("No index to save")
-        
+
+        self._ensure_metadata()
+        self._flush_pending()
+
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(index_path), exist_ok=True)
-        
-        # Save FAISS index
-        faiss.write_index(self.index, index_path)
-        
-        # Save metadata
-        with open(metadata_path, 'w') as f:
-            json.dump(self.metadata, f)
-        
+
+        # Save FAISS index; GPU indices do not serialize, so write a CPU
+        # copy. Both files go through a tmp path and an atomic rename, so a
+        # crash mid-write never leaves a truncated index behind.
+        index = self.index
+        if self.use_gpu and self._gpu_resources is not None:
+            index = faiss.index_gpu_to_cpu(index)
+        faiss.write_index(index, index_path + ".tmp")
+        os.replace(index_path + ".tmp", index_path)
+
+        # Pickle serializes the metadata columns in C, far faster and more
+        # compact than the JSON dump it replaces; the id table rides along.
+        # Metadata is append-only between removals, so an unchanged state
+        # means the bytes on disk are still current and the rewrite is skipped.
+        state = (len(self.metadata), len(self._id_to_row))
+        if state != self._metadata_saved_state:
+            payload = {
+                "columns": self.metadata,
+                "id_to_row": self._id_to_row,
+                "next_id": self.next_id,
+            }
+            with open(metadata_path + ".tmp", 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(metadata_path + ".tmp", metadata_path)
+            self._metadata_saved_state = state
+
+        self._dirty = False
+        self._adds_since_save = 0
         self.logger.info(f"Saved vector store with {self.index.ntotal} documents")
     
     def load(self, index_path: Optional[str] = None, metadata_path: Optional[str] = None) -> bool:
@@ -164,7 +543,7 @@ class FaissVectorStore:
         index_path : str, optional
             Path to load the FAISS index from
         metadata_path : str, optional
-            Path to load the metadata JSON file from
+            Path to load the metadata pickle file from
             
         Returns
         -------
@@ -175,15 +554,104 @@ class FaissVectorStore:
         metadata_path = metadata_path or self.metadata_path
         
         try:
-            # Load FAISS index
-            self.index = faiss.read_index(index_path)
-            
-            # Load metadata
-            with open(metadata_path, 'r') as f:
-                self.metadata = json.load(f)
-            
+            # Load FAISS index. With MMAP_INDEX the file is mapped instead of
+            # read into RAM: startup touches no vector data and searches page
+            # in only what they visit. The mapping is read-only, so indexing
+            # runs (add_documents) must keep the default in-RAM load.
+            if Config.MMAP_INDEX:
+                self.index = faiss.read_index(
+                    index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+            else:
+                self.index = faiss.read_index(index_path)
+
+            # Restore search-time parameters that are not serialized; they
+            # live on the inner index behind the IDMap2 wrapper
+            try:
+                self._base_index = faiss.downcast_index(self.index.index)
+            except (AttributeError, RuntimeError):
+                # Index predates the IDMap2 wrapper: searches still work
+                # (positions double as ids) but adds/removes need a re-index
+                self._base_index = self.index
+                self.logger.warning("Loaded index without id mapping; re-index to enable add/remove")
+            if hasattr(self._base_index, "nprobe"):
+                self._base_index.nprobe = Config.IVF_NPROBE
+            if hasattr(self._base_index, "hnsw"):
+                self._base_index.hnsw.efSearch = Config.HNSW_EF_SEARCH
+
+            self._maybe_to_gpu()
+
+            # Defer metadata deserialization to first access; processes that
+            # only open the index (status checks, index-only tooling) skip
+            # the unpickle cost and its resident memory entirely
+            if not os.path.exists(metadata_path) and os.path.exists(self._legacy_metadata_path):
+                self._pending_metadata_path = self._legacy_metadata_path
+            elif os.path.exists(metadata_path):
+                self._pending_metadata_path = metadata_path
+            else:
+                raise FileNotFoundError(metadata_path)
+
             self.logger.info(f"Loaded vector store with {self.index.ntotal} documents")
             return True
         except (FileNotFoundError, IOError) as e:
             self.logger.error(f"Failed to load vector store: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def _ensure_metadata(self) -> None:
+        """Deserialize the metadata file on first access after `load()`."""
+        path = self._pending_metadata_path
+        if path is None:
+            return
+        self._pending_metadata_path = None
+
+        try:
+            if path == self._legacy_metadata_path:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+            else:
+                with open(path, 'rb') as f:
+                    data = pickle.load(f)
+
+            # Files written before the columnar layout hold a list of dicts;
+            # ones from before stable ids hold bare columns. Both map ids to
+            # rows one-to-one.
+            if isinstance(data, list):
+                columns = _MetadataColumns()
+                for row in data:
+                    columns.append(row)
+                data = columns
+            if isinstance(data, _MetadataColumns):
+                data = {
+                    "columns": data,
+                    "id_to_row": {i: i for i in range(len(data))},
+                    "next_id": len(data),
+                }
+            self.metadata = data["columns"]
+            self._id_to_row = data["id_to_row"]
+            self.next_id = data["next_id"]
+        except (OSError, EOFError, pickle.PickleError, ValueError, KeyError, TypeError) as e:
+            # Same degradation the eager load path used to give at
+            # construction: a corrupt or truncated metadata file resets the
+            # store to a fresh empty index instead of raising on the first
+            # search or add
+            self.logger.error(f"Failed to load metadata from {path}, resetting vector store: {e}")
+            self.metadata = _MetadataColumns()
+            self._id_to_row = {}
+            self.next_id = 0
+            self._metadata_saved_state = None
+            self._create_empty_index()
+            return
+        self._metadata_saved_state = (len(self.metadata), len(self._id_to_row))
+
+        if os.path.exists(self._legacy_metadata_path):
+            # Same atomic pattern as save(): a crash mid-migration must not
+            # leave a truncated pickle shadowing the intact legacy file
+            try:
+                with open(self.metadata_path + ".tmp", 'wb') as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(self.metadata_path + ".tmp", self.metadata_path)
+                os.remove(self._legacy_metadata_path)
+                self.logger.info(f"Migrated metadata from {self._legacy_metadata_path} to {self.metadata_path}")
+            except OSError as e:
+                # Migration is an optimization; the legacy file stays usable
+                self.logger.warning(f"Failed to migrate legacy metadata: {e}")
\ No newline at end of file